@@ -0,0 +1,44 @@
+"""
+author_classify 설정
+- 매칭/판별 단계의 신뢰도, 가중치, 임계값 (보고서 수치 기준)
+"""
+
+# Section 15: 5-Level 퍼지 매칭 신뢰도
+NAME_MATCH_SCORES = {"L1": 1.0, "L2": 0.9, "L3": 0.8, "L4": 0.7, "L5": 0.5}
+# L5 편집거리: 이 정규화 유사도 이상만 후보 (점수 = 0.5 + 초과분)
+L5_MIN_SIMILARITY = 0.8
+
+# Section 13: 5-Signal 가중치 (Signal 1 확정 식별자는 점수 없이 우선 적용)
+SIGNAL_WEIGHTS = {"network": 0.30, "topic": 0.25, "temporal": 0.20, "meta": 0.10}
+# 판별 기준: 점수 >= 0.7 & 1위-2위 차이 >= 0.2 → 자동 확정
+AUTO_CONFIRM_SCORE = 0.7
+AUTO_CONFIRM_MARGIN = 0.2
+# 점수 >= 0.5 & 차이 < 0.2 → 수동 검토, 0.4~0.7 → LLM 보완, < 0.5 → RIMS 미등록 가능성
+MANUAL_REVIEW_SCORE = 0.5
+LLM_REVIEW_SCORE = 0.4
+
+# Section 8.3 / 10.1: LLM 2차 판별 (1차 수학 모델 신뢰도 < AUTO_CONFIRM_SCORE 케이스)
+LLM_MODEL = "claude-sonnet-4-5-20250929"
+LLM_CONCURRENCY = 8
+LLM_REQUESTS_PER_MINUTE = 50
+LLM_INPUT_TOKENS_PER_MINUTE = 40_000
+LLM_MAX_RETRIES = 5
+# LLM 응답 캐시 (동일 프롬프트 재호출 방지)
+LLM_CACHE_TTL_DAYS = 180
+LLM_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Message Batches 모드 (Section 9.2 대량 백필)
+LLM_BATCH_MAX_REQUESTS = 10_000
+LLM_BATCH_POLL_SECONDS = 60
+# 역할 판별 묶음 요청: 요청당 입력 토큰 예산 / 최대 논문 수 / 논문당 출력 토큰 예상치
+LLM_PACK_INPUT_TOKENS = 6000
+LLM_PACK_MAX_PAPERS = 12
+LLM_PACK_OUTPUT_TOKENS_PER_PAPER = 400
+# LLM 라우팅 (Section 13): 최선 후보의 0 아닌 신호 수가 이보다 적으면 LLM 도 근거 부족 → 수동 검토
+LLM_MIN_COVERAGE = 2
+# 1·2위 점수 차이가 이보다 작으면 두 후보를 가를 근거가 없음 → 수동 검토
+LLM_MIN_MARGIN = 0.01
+# 비용/지연 추정: USD / 100만 토큰 (배치는 50%), 동명이인 응답 1건 출력 토큰, 요청 1건 평균 응답 시간(초)
+LLM_PRICE_PER_MTOK = {"input": 3.0, "output": 15.0}
+LLM_BATCH_PRICE_FACTOR = 0.5
+LLM_OUTPUT_TOKENS = 200
+LLM_LATENCY_SECONDS = 6.0
@@ -0,0 +1,3 @@
+"""
+RIMS 데이터 로딩/집계
+"""
@@ -0,0 +1,301 @@
+"""
+RIMS 저자 참여 데이터 로더
+- rims_article_parti_data.csv 에서 부록 A의 7개 컬럼 + SCOPUS_ID 만 청크 단위로 읽음
+- 정수 컬럼은 int64/int8, 문자열 컬럼(PRTCPNT_ID 포함)은 int32 코드 + 어휘집으로 변환
+- 첫 로드 시 덤프 체크섬별 .npy 캐시 생성, 이후에는 mmap 으로 즉시 로드
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+# 부록 A: rims_article_parti_data.csv 에서 사용하는 필드 (+ Signal 1 확정 식별자 SCOPUS_ID)
+PARTICIPANT_COLUMNS = [
+    "ARTICLE_ID", "PRTCPNT_ID", "PRTCPNT_NM", "TPI_DVS_CD",
+    "BLNG_AGC_NM", "ORCID_ID", "SCOPUS_ID", "EMAL_ADDR",
+]
+# 정수 컬럼 (결측 = MISSING)
+INT_COLUMNS = {"ARTICLE_ID": np.int64, "TPI_DVS_CD": np.int8}
+# 범주형 컬럼: int32 코드 (결측 = MISSING) + 어휘집
+# PRTCPNT_ID 는 숫자가 아닌 ID 도 있을 수 있어 문자열로 보관 (코드 = 조밀한 연구자 번호)
+CATEGORY_COLUMNS = ["PRTCPNT_ID", "PRTCPNT_NM", "BLNG_AGC_NM", "ORCID_ID", "SCOPUS_ID", "EMAL_ADDR"]
+
+MISSING = -1
+DEFAULT_CHUNKSIZE = 200_000
+DEFAULT_CACHE_DIR = ".rims_cache"
+# 캐시 형식이 바뀌면 올림
+CACHE_VERSION = 3
+
+_HASH_BLOCK = 1 << 20
+
+
+def file_checksum(path):
+    """SHA-256 of the file contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class Vocabulary:
+    """Code -> string table stored as one UTF-8 blob plus offsets.
+
+    Both arrays are memory-mapped from the cache, so opening a vocabulary
+    of 300K names costs nothing until values are decoded.
+    """
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+        self._index = None
+
+    @classmethod
+    def from_values(cls, values):
+        encoded = [v.encode("utf-8") for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(blob, offsets)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, code):
+        if code == MISSING:
+            return None
+        start, end = self._offsets[code], self._offsets[code + 1]
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        return (self[code] for code in range(len(self)))
+
+    def code(self, value):
+        """Code of `value`, or MISSING if it never occurs (builds an index once)."""
+        if self._index is None:
+            self._index = {v: c for c, v in enumerate(self)}
+        return self._index.get(value, MISSING)
+
+    def decode(self, codes):
+        return [self[int(c)] for c in codes]
+
+
+class ParticipantTable:
+    """Columnar participant records: one array per column.
+
+    Integer columns hold their values (MISSING for blanks); category
+    columns hold int32 codes into `vocab[column]`.  Arrays are read-only
+    memory maps when loaded from the cache.
+    """
+
+    def __init__(self, columns, vocab, checksum=None):
+        self.columns = columns
+        self.vocab = vocab
+        self.checksum = checksum
+
+    def __len__(self):
+        return len(self.columns["ARTICLE_ID"])
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def values(self, column, rows=None):
+        """Decoded strings of a category column (optionally for `rows` only)."""
+        codes = self.columns[column] if rows is None else self.columns[column][rows]
+        return self.vocab[column].decode(codes)
+
+    def to_frame(self):
+        """pandas DataFrame with Int columns and Categorical name columns."""
+        data = {}
+        for column in PARTICIPANT_COLUMNS:
+            arr = self.columns[column]
+            if column in self.vocab:
+                data[column] = pd.Categorical.from_codes(arr, categories=list(self.vocab[column]))
+            else:
+                arr = np.asarray(arr)
+                data[column] = pd.arrays.IntegerArray(arr, mask=arr == MISSING)
+        return pd.DataFrame(data)
+
+
+def _factorize(series):
+    """Codes into the stripped, non-empty unique values of `series`.
+
+    Stripping and parsing then only touch the (few) unique values instead
+    of every row.  Blank or missing cells get MISSING.
+    """
+    local, uniques = pd.factorize(series)
+    stripped = pd.Series(uniques, dtype=object).str.strip()
+    stripped[stripped == ""] = None
+    inner, values = pd.factorize(stripped)
+    codes = np.full(len(local), MISSING, dtype=np.int64)
+    present = local >= 0
+    codes[present] = inner[local[present]]
+    return codes, values
+
+
+def _take(codes, mapping, dtype):
+    out = np.full(len(codes), MISSING, dtype=dtype)
+    present = codes >= 0
+    out[present] = mapping[codes[present]]
+    return out
+
+
+def canonical_id(values):
+    """Digit-only IDs without leading zeros ('00123' -> '123'); others unchanged."""
+    values = pd.Series(values, dtype=object)
+    digits = values.str.fullmatch(r"\d+").fillna(False).to_numpy(dtype=bool)
+    values[digits] = values[digits].str.lstrip("0").replace("", "0")
+    return values.to_numpy(dtype=object)
+
+
+class _Factorizer:
+    """Incremental string -> int32 code assignment across chunks.
+
+    `canonical` maps the stripped unique values of a chunk to the form that
+    is stored (values that become equal share one code).
+    """
+
+    def __init__(self, canonical=None):
+        self.index = pd.Index([], dtype=object)
+        self.canonical = canonical
+
+    def __call__(self, series):
+        codes, values = _factorize(series)
+        if self.canonical is not None:
+            merged, values = pd.factorize(self.canonical(values))
+            codes = _take(codes, merged, np.int64)
+        mapping = self.index.get_indexer(values)
+        new = mapping == MISSING
+        mapping[new] = np.arange(len(self.index), len(self.index) + new.sum())
+        self.index = self.index.append(pd.Index(values[new], dtype=object))
+        return _take(codes, mapping, np.int32)
+
+    def vocabulary(self):
+        return Vocabulary.from_values(self.index)
+
+
+def _to_int(series, dtype, column):
+    codes, values = _factorize(series)
+    numbers = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+    bad = numbers.isna().to_numpy()
+    if bad.any():
+        # 청크 인덱스 = CSV 데이터 행 번호 (0부터)
+        rows = series.index[np.isin(codes, np.flatnonzero(bad))]
+        raise ValueError(f"{column}: {len(rows)} non-integer value(s) in this chunk, "
+                         f"first at data row {rows[0]}: {series.loc[rows[0]]!r}")
+    return _take(codes, numbers.to_numpy(dtype=dtype), dtype)
+
+
+def read_participants(path, chunksize=DEFAULT_CHUNKSIZE, encoding="utf-8-sig"):
+    """Read the participant CSV into a `ParticipantTable` (no cache)."""
+    factorizers = {column: _Factorizer(canonical_id if column == "PRTCPNT_ID" else None)
+                   for column in CATEGORY_COLUMNS}
+    parts = {column: [] for column in PARTICIPANT_COLUMNS}
+    reader = pd.read_csv(path, usecols=PARTICIPANT_COLUMNS, dtype=str,
+                         chunksize=chunksize, encoding=encoding)
+    for chunk in reader:
+        for column, dtype in INT_COLUMNS.items():
+            parts[column].append(_to_int(chunk[column], dtype, column))
+        for column, factorize in factorizers.items():
+            parts[column].append(factorize(chunk[column]))
+
+    columns = {}
+    for column in PARTICIPANT_COLUMNS:
+        dtype = INT_COLUMNS.get(column, np.int32)
+        columns[column] = np.concatenate(parts[column]) if parts[column] else np.empty(0, dtype)
+    vocab = {column: f.vocabulary() for column, f in factorizers.items()}
+    return ParticipantTable(columns, vocab)
+
+
+def _cached_checksum(path, cache_dir):
+    """Checksum of `path`, reusing the last result while size/mtime are unchanged."""
+    st = os.stat(path)
+    stamp = {"path": os.path.abspath(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    stamp_path = os.path.join(cache_dir, "checksums.json")
+    try:
+        with open(stamp_path, encoding="utf-8") as f:
+            known = json.load(f)
+    except (FileNotFoundError, ValueError):
+        known = []
+    for entry in known:
+        if entry["stamp"] == stamp:
+            return entry["checksum"]
+
+    checksum = file_checksum(path)
+    known = [e for e in known if e["stamp"]["path"] != stamp["path"]]
+    known.append({"stamp": stamp, "checksum": checksum})
+    tmp = stamp_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(known, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, stamp_path)
+    return checksum
+
+
+def _save_table(table, target):
+    """Write `table` as .npy files into `target` atomically (via a temp dir)."""
+    tmp = f"{target}.tmp{os.getpid()}"
+    os.makedirs(tmp)
+    try:
+        for column, arr in table.columns.items():
+            np.save(os.path.join(tmp, f"{column}.npy"), arr)
+        for column, vocab in table.vocab.items():
+            np.save(os.path.join(tmp, f"{column}.vocab.npy"), vocab._blob)
+            np.save(os.path.join(tmp, f"{column}.offsets.npy"), vocab._offsets)
+        meta = {"version": CACHE_VERSION, "checksum": table.checksum, "rows": len(table)}
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, target)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.isdir(target):  # 동시에 다른 프로세스가 먼저 만든 경우는 정상
+            raise
+
+
+def _load_table(target, checksum):
+    try:
+        with open(os.path.join(target, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    if meta.get("version") != CACHE_VERSION:
+        return None
+
+    def npy(name):
+        return np.load(os.path.join(target, f"{name}.npy"), mmap_mode="r")
+
+    columns = {column: npy(column) for column in PARTICIPANT_COLUMNS}
+    vocab = {column: Vocabulary(npy(f"{column}.vocab"), npy(f"{column}.offsets"))
+             for column in CATEGORY_COLUMNS}
+    return ParticipantTable(columns, vocab, checksum)
+
+
+def load_participants(path, cache_dir=DEFAULT_CACHE_DIR, chunksize=DEFAULT_CHUNKSIZE,
+                      encoding="utf-8-sig", refresh=False):
+    """Load the participant CSV through the columnar cache.
+
+    The cache is keyed by the SHA-256 of the dump, so a new monthly dump
+    gets a fresh entry and an unchanged one is memory-mapped in well under
+    a second.  `cache_dir=None` disables caching; `refresh` rebuilds.
+    """
+    if cache_dir is None:
+        return read_participants(path, chunksize, encoding)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    checksum = _cached_checksum(path, cache_dir)
+    # 형식 버전을 경로에 넣어 이전 CACHE_VERSION 의 디렉터리와 겹치지 않게 함
+    target = os.path.join(cache_dir, f"participants-v{CACHE_VERSION}-{checksum[:16]}")
+    if not refresh:
+        table = _load_table(target, checksum)
+        if table is not None:
+            return table
+    if os.path.isdir(target):
+        # refresh 또는 읽을 수 없는(중단된/이전 형식) 캐시 → 지우고 다시 기록
+        shutil.rmtree(target)
+
+    table = read_participants(path, chunksize, encoding)
+    table.checksum = checksum
+    _save_table(table, target)
+    return table
@@ -0,0 +1,157 @@
+"""
+RIMS 덤프 통계 집계기
+- rims_article_data.csv / rims_article_parti_data.csv 를 청크 단위로 한 번만 읽음
+- 메모리는 행 수가 아니라 고유 논문/이름/연구자 수에 비례
+"""
+from collections import Counter, defaultdict
+
+import pandas as pd
+
+ARTICLE_COLUMNS = ["ARTICLE_ID", "ABST_CNTN", "PBLC_YM", "DOI", "ID_KCI"]
+PARTI_COLUMNS = [
+    "ARTICLE_ID", "PRTCPNT_ID", "PRTCPNT_NM", "TPI_DVS_CD",
+    "BLNG_AGC_NM", "ORCID_ID", "SCOPUS_ID", "EMAL_ADDR",
+]
+
+DEFAULT_CHUNKSIZE = 200_000
+
+
+def _present(series):
+    """Boolean mask of non-empty values."""
+    return series.notna() & (series.str.strip() != "")
+
+
+def _month_index(ym):
+    return int(ym[:4]) * 12 + int(ym[4:6]) - 1
+
+
+class RimsStatsAggregator:
+    """Single-pass aggregator over article and participant chunks.
+
+    Feed every article chunk through `add_articles` before the participant
+    chunks, then call `result()` for a `ReportContext`-compatible dict.
+    """
+
+    def __init__(self, recent_months=12, top_homonyms=5):
+        self.recent_months = recent_months
+        self.top_homonyms = top_homonyms
+
+        self.papers_total = 0
+        self.kci_papers = 0
+        self.kci_with_doi = 0
+        self.abstracts = 0
+        self.kci_abstracts = 0
+        self.article_month = {}          # ARTICLE_ID -> YYYYMM
+        self.month_counts = Counter()    # YYYYMM -> 논문 수
+
+        self.participant_records = 0
+        self.records_without_id = 0
+        self.tpi_counts = Counter()
+        self.names = set()
+        self.name_ids = defaultdict(set)     # PRTCPNT_NM -> {PRTCPNT_ID}
+        self.id_affiliations = defaultdict(set)
+        self.ids = set()
+        self.orcid_ids = set()
+        self.scopus_ids = set()
+        self.email_ids = set()
+        self.article_participants = Counter()
+
+    def add_articles(self, chunk):
+        self.papers_total += len(chunk)
+        kci = _present(chunk["ID_KCI"])
+        has_abstract = _present(chunk["ABST_CNTN"])
+        self.kci_papers += int(kci.sum())
+        self.kci_with_doi += int((kci & _present(chunk["DOI"])).sum())
+        self.abstracts += int(has_abstract.sum())
+        self.kci_abstracts += int((kci & has_abstract).sum())
+
+        ym = chunk["PBLC_YM"].str.replace(r"\D", "", regex=True).str[:6]
+        valid = ym.str.len() == 6
+        months = ym[valid]
+        self.month_counts.update(months.value_counts().to_dict())
+        self.article_month.update(zip(chunk["ARTICLE_ID"][valid], months))
+
+    def add_participants(self, chunk):
+        self.participant_records += len(chunk)
+        self.article_participants.update(chunk["ARTICLE_ID"].value_counts().to_dict())
+        self.tpi_counts.update(chunk["TPI_DVS_CD"].dropna().str.strip().value_counts().to_dict())
+        self.names.update(chunk["PRTCPNT_NM"].dropna().unique())
+
+        has_id = _present(chunk["PRTCPNT_ID"])
+        self.records_without_id += int((~has_id).sum())
+        with_id = chunk[has_id]
+        self.ids.update(with_id["PRTCPNT_ID"].unique())
+
+        pairs = with_id[["PRTCPNT_NM", "PRTCPNT_ID"]].dropna().drop_duplicates()
+        for name, pid in pairs.itertuples(index=False):
+            self.name_ids[name].add(pid)
+        pairs = with_id[["PRTCPNT_ID", "BLNG_AGC_NM"]].dropna().drop_duplicates()
+        for pid, agency in pairs.itertuples(index=False):
+            self.id_affiliations[pid].add(agency.strip())
+
+        for column, holders in (("ORCID_ID", self.orcid_ids),
+                                ("SCOPUS_ID", self.scopus_ids),
+                                ("EMAL_ADDR", self.email_ids)):
+            holders.update(with_id.loc[_present(with_id[column]), "PRTCPNT_ID"].unique())
+
+    def _monthly(self):
+        """Average papers / participant records per month over the recent window.
+
+        The window is the last `recent_months` months, or fewer when the dump
+        covers a shorter span.
+        """
+        if not self.month_counts:
+            return 0, 0
+        months = [_month_index(ym) for ym in self.month_counts]
+        first, last = min(months), max(months)
+        span = min(self.recent_months, last - first + 1)
+        window = {ym for ym in self.month_counts
+                  if last - self.recent_months < _month_index(ym) <= last}
+        papers = sum(self.month_counts[ym] for ym in window)
+        records = sum(self.article_participants[aid]
+                      for aid, ym in self.article_month.items() if ym in window)
+        return papers / span, records / span
+
+    def result(self):
+        homonyms = {name: len(ids) for name, ids in self.name_ids.items() if len(ids) > 1}
+        top = sorted(homonyms.items(), key=lambda item: (-item[1], item[0]))
+        monthly_papers, monthly_records = self._monthly()
+        return {
+            "papers_total": self.papers_total,
+            "kci_papers": self.kci_papers,
+            "kci_with_doi": self.kci_with_doi,
+            "kci_only": self.kci_papers - self.kci_with_doi,
+            "participant_records": self.participant_records,
+            "unique_names": len(self.names),
+            "unique_prtcpnt_ids": len(self.ids),
+            "records_without_id": self.records_without_id,
+            "tpi_counts": dict(self.tpi_counts),
+            "homonym_people": sum(homonyms.values()),
+            "top_homonyms": top[:self.top_homonyms],
+            "multi_affiliation_ids": sum(1 for agencies in self.id_affiliations.values()
+                                         if len(agencies) > 1),
+            "abstract_rate": self.abstracts / self.papers_total if self.papers_total else 0.0,
+            "kci_abstract_rate": self.kci_abstracts / self.kci_papers if self.kci_papers else 0.0,
+            "orcid_ids": len(self.orcid_ids),
+            "scopus_ids": len(self.scopus_ids),
+            "email_ids": len(self.email_ids),
+            "coauthored_papers": sum(1 for n in self.article_participants.values() if n > 1),
+            "monthly_papers": monthly_papers,
+            "monthly_author_records": monthly_records,
+        }
+
+
+def _read_chunks(path, columns, chunksize, encoding):
+    return pd.read_csv(path, usecols=columns, dtype=str, chunksize=chunksize,
+                       encoding=encoding)
+
+
+def collect_stats(article_csv, parti_csv, chunksize=DEFAULT_CHUNKSIZE,
+                  encoding="utf-8-sig", recent_months=12):
+    """Stream both RIMS CSVs once and return the report statistics dict."""
+    agg = RimsStatsAggregator(recent_months=recent_months)
+    for chunk in _read_chunks(article_csv, ARTICLE_COLUMNS, chunksize, encoding):
+        agg.add_articles(chunk)
+    for chunk in _read_chunks(parti_csv, PARTI_COLUMNS, chunksize, encoding):
+        agg.add_participants(chunk)
+    return agg.result()
@@ -0,0 +1,3 @@
+"""
+저자 동일성 판별 (동명이인 구분 / 동일저자 추적)
+"""
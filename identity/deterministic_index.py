@@ -0,0 +1,228 @@
+"""
+확정 식별자 인덱스 (Signal 1)
+- PRTCPNT_ID / ORCID / SCOPUS_ID / 이메일 → author_identity id
+- 정규화한 (식별자 종류, 값)의 64비트 해시를 정렬 배열로 보관, searchsorted 로 조회
+- 덤프(체크섬)마다 한 번 만들어 .npy 로 캐시, 퍼지/네트워크 채점 전에 조회해
+  확정된 레코드는 Signal 2~5 를 건너뜀
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+
+from data.rims_loader import DEFAULT_CACHE_DIR, MISSING
+from utils.text_normalizer import normalize_text
+
+# 조회 우선순위 순서
+ID_COLUMNS = ("PRTCPNT_ID", "ORCID_ID", "SCOPUS_ID", "EMAL_ADDR")
+# 같은 식별자가 서로 다른 저자에 연결된 경우 (공용 이메일 등) → 확정에 쓰지 않음
+CONFLICT = -2
+# Signal 2~5 (공저자, 주제, 시계열, 메타데이터)
+SKIPPED_SIGNALS = 4
+INDEX_VERSION = 2
+
+_ORCID_URL = re.compile(r"^(https?://)?(www\.)?orcid\.org/")
+_NO_KEY = np.uint64(0)
+
+
+def normalize_orcid(value):
+    """'https://orcid.org/0000-0002-1825-009x' -> '000000021825009X' (None if malformed)."""
+    value = normalize_text(value)
+    if value is None:
+        return None
+    compact = re.sub(r"[^0-9x]", "", _ORCID_URL.sub("", value)).upper()
+    return compact if len(compact) == 16 else None
+
+
+def normalize_scopus(value):
+    digits = re.sub(r"\D", "", str(value or ""))
+    return digits.lstrip("0") or None
+
+
+def normalize_email(value):
+    value = normalize_text(value)
+    return value.replace(" ", "") if value and "@" in value else None
+
+
+def _normalize_id(value):
+    """PRTCPNT_ID as stored by the loader (digit-only IDs without leading zeros)."""
+    value = None if value is None else str(value).strip()
+    if not value:
+        return None
+    return (value.lstrip("0") or "0") if value.isdigit() else value
+
+
+_NORMALIZERS = {
+    "PRTCPNT_ID": _normalize_id,
+    "ORCID_ID": normalize_orcid,
+    "SCOPUS_ID": normalize_scopus,
+    "EMAL_ADDR": normalize_email,
+}
+
+
+def id_key(column, value):
+    """64-bit key of a normalized identifier (0 = no usable identifier)."""
+    value = _NORMALIZERS[column](value)
+    if value is None:
+        return 0
+    digest = hashlib.blake2b(f"{column}\0{value}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def record_keys(table, column):
+    """uint64 key of `column` for every record of a `ParticipantTable`.
+
+    Only distinct values are normalized and hashed (vocabulary entries or
+    unique integers), then broadcast back to the rows.
+    """
+    arr = np.asarray(table[column])
+    if column in table.vocab:
+        vocab_keys = np.fromiter((id_key(column, v) for v in table.vocab[column]),
+                                 dtype=np.uint64, count=len(table.vocab[column]))
+        codes = arr
+    else:
+        uniques, codes = np.unique(arr, return_inverse=True)
+        vocab_keys = np.fromiter((id_key(column, int(v)) for v in uniques),
+                                 dtype=np.uint64, count=len(uniques))
+    keys = np.zeros(len(arr), dtype=np.uint64)
+    present = codes >= 0
+    keys[present] = vocab_keys[codes[present]]
+    return keys
+
+
+class DeterministicIndex:
+    """Sorted identifier keys -> author_identity id (CONFLICT if ambiguous)."""
+
+    def __init__(self, keys, identities):
+        self.keys = keys
+        self.identities = identities
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def build(cls, table, identity_ids=None):
+        """Index every identifier of `table`'s records.
+
+        `identity_ids[k]` is the author_identity of record `k`; by default
+        the record's PRTCPNT_ID code (records without one are not indexed).
+        """
+        identity_ids = np.asarray(table["PRTCPNT_ID"] if identity_ids is None else identity_ids,
+                                  dtype=np.int64)
+        keys, ids = [], []
+        for column in ID_COLUMNS:
+            k = record_keys(table, column)
+            valid = (k != _NO_KEY) & (identity_ids >= 0)
+            keys.append(k[valid])
+            ids.append(identity_ids[valid])
+        keys = np.concatenate(keys)
+        ids = np.concatenate(ids)
+
+        # (키, 저자) 중복 제거 후 키마다 저자가 둘 이상이면 CONFLICT
+        order = np.lexsort((ids, keys))
+        keys, ids = keys[order], ids[order]
+        distinct = np.r_[True, (keys[1:] != keys[:-1]) | (ids[1:] != ids[:-1])]
+        keys, ids = keys[distinct], ids[distinct]
+        unique_keys, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+        identities = ids[starts]
+        identities[counts > 1] = CONFLICT
+        return cls(unique_keys, identities)
+
+    def lookup(self, keys):
+        """author_identity per key: MISSING if unknown, CONFLICT if ambiguous."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        pos = np.minimum(np.searchsorted(self.keys, keys), max(len(self.keys) - 1, 0))
+        out = np.full(len(keys), MISSING, dtype=np.int64)
+        if len(self.keys):
+            hit = (self.keys[pos] == keys) & (keys != _NO_KEY)
+            out[hit] = self.identities[pos[hit]]
+        return out
+
+    def resolve(self, table):
+        """Resolve records before any fuzzy or network scoring.
+
+        Returns ``(identities, resolved_by, stats)``: the author_identity of
+        each record (MISSING if unresolved), the index into `ID_COLUMNS` of
+        the identifier that resolved it (-1 if none), and short-circuit
+        statistics.  Only unresolved records need Signals 2-5.
+        """
+        n = len(table)
+        identities = np.full(n, MISSING, dtype=np.int64)
+        resolved_by = np.full(n, -1, dtype=np.int8)
+        ambiguous = np.zeros(n, dtype=bool)
+        by_identifier = {}
+        for i, column in enumerate(ID_COLUMNS):
+            found = self.lookup(record_keys(table, column))
+            ambiguous |= found == CONFLICT
+            take = (found >= 0) & (identities == MISSING)
+            identities[take] = found[take]
+            resolved_by[take] = i
+            by_identifier[column] = int(take.sum())
+
+        resolved = int((identities >= 0).sum())
+        stats = {
+            "records": n,
+            "resolved": resolved,
+            "unresolved": n - resolved,
+            "resolved_rate": resolved / n if n else 0.0,
+            "by_identifier": by_identifier,
+            "ambiguous_identifiers": int((ambiguous & (identities == MISSING)).sum()),
+            "skipped_signal_evaluations": resolved * SKIPPED_SIGNALS,
+        }
+        return identities, resolved_by, stats
+
+    def save(self, target):
+        """Write the index into directory `target` atomically (via a temp dir)."""
+        tmp = f"{target}.tmp{os.getpid()}"
+        os.makedirs(tmp)
+        try:
+            np.save(os.path.join(tmp, "keys.npy"), self.keys)
+            np.save(os.path.join(tmp, "identities.npy"), self.identities)
+            with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "keys": len(self)}, f)
+            os.replace(tmp, target)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(target):
+                raise
+
+    @classmethod
+    def open(cls, target):
+        """Memory-map a saved index; None if missing or from another version."""
+        try:
+            with open(os.path.join(target, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        if meta.get("version") != INDEX_VERSION:
+            return None
+        return cls(np.load(os.path.join(target, "keys.npy"), mmap_mode="r"),
+                   np.load(os.path.join(target, "identities.npy"), mmap_mode="r"))
+
+
+def load_index(table, identity_ids=None, cache_dir=DEFAULT_CACHE_DIR):
+    """`DeterministicIndex` of `table`, built once per dump and identity mapping.
+
+    The cache entry is keyed by the dump checksum (`table.checksum`, set by
+    `load_participants`) and a hash of `identity_ids`.
+    """
+    if cache_dir is None or table.checksum is None:
+        return DeterministicIndex.build(table, identity_ids)
+    tag = "rims"
+    if identity_ids is not None:
+        tag = hashlib.sha256(np.ascontiguousarray(identity_ids, dtype=np.int64)).hexdigest()[:12]
+    # 형식 버전을 경로에 넣어 이전 INDEX_VERSION 의 디렉터리와 겹치지 않게 함
+    target = os.path.join(cache_dir, f"ids-v{INDEX_VERSION}-{table.checksum[:16]}-{tag}")
+    index = DeterministicIndex.open(target)
+    if index is not None:
+        return index
+    if os.path.isdir(target):
+        # 읽을 수 없는(중단된/이전 형식) 캐시 → 지우고 다시 기록
+        shutil.rmtree(target)
+    os.makedirs(cache_dir, exist_ok=True)
+    index = DeterministicIndex.build(table, identity_ids)
+    index.save(target)
+    return index
@@ -0,0 +1,111 @@
+"""
+5-Signal 저자 동일성 판별 (Section 12, 13)
+- 후보 쌍 블록 전체를 NumPy 배열로 채점: 신호는 열, 가중치는 벡터 (열 단위 누적)
+- 질의별 1위/2위는 정렬 한 번으로 구하고 마진 판정도 배열 연산으로 처리
+- 가중치/임계값은 config.py (호출 시 재지정 가능)
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from config import (
+    AUTO_CONFIRM_MARGIN, AUTO_CONFIRM_SCORE, LLM_REVIEW_SCORE, MANUAL_REVIEW_SCORE,
+    SIGNAL_WEIGHTS,
+)
+
+# 신호 열 순서
+SIGNALS = ("network", "topic", "temporal", "meta")
+
+# 판별 결과 코드
+CONFIRMED = 0       # 자동 확정
+MANUAL_REVIEW = 1   # 동명이인 의심, 수동 검토
+LLM_REVIEW = 2      # 경계 사례, LLM 보완 판별
+UNREGISTERED = 3    # RIMS 미등록 연구자 가능성
+DECISION_LABELS = ("자동 확정", "수동 검토", "LLM 보완", "미등록 가능성")
+
+# query: 질의 ID, best: 1위 후보 행 (입력 기준 위치), candidates: 질의별 후보 수
+Decisions = namedtuple("Decisions", "query best score second margin decision candidates")
+
+
+def weight_vector(weights=None):
+    """Weights in `SIGNALS` order from a {signal: weight} dict (config default)."""
+    weights = dict(SIGNAL_WEIGHTS, **(weights or {}))
+    unknown = set(weights) - set(SIGNALS)
+    if unknown:
+        raise KeyError(f"알 수 없는 신호: {', '.join(sorted(unknown))}")
+    return np.array([weights[s] for s in SIGNALS], dtype=np.float64)
+
+
+def signal_matrix(signals):
+    """(n, 4) float32 matrix from a {signal: array} dict or an (n, 4) array.
+
+    Signals missing from a dict count as 0 (e.g. no temporal data yet).
+    """
+    if not isinstance(signals, dict):
+        return np.asarray(signals, dtype=np.float32).reshape(-1, len(SIGNALS))
+    n = len(next(iter(signals.values())))
+    matrix = np.zeros((n, len(SIGNALS)), dtype=np.float32)
+    for column, name in enumerate(SIGNALS):
+        if name in signals:
+            matrix[:, column] = signals[name]
+    return matrix
+
+
+def total_scores(signals, weights=None):
+    """Weighted total for every candidate pair (signal matrix times weight vector).
+
+    Totals are float64 so a score of exactly 0.7 is not lost to rounding,
+    and are accumulated column by column so a pair's total does not depend
+    on how pairs are batched (sharded runs match serial ones bit for bit).
+    """
+    matrix = signal_matrix(signals)
+    totals = np.zeros(len(matrix), dtype=np.float64)
+    for column, weight in enumerate(weight_vector(weights)):
+        totals += matrix[:, column] * weight
+    return totals
+
+
+def decide(query, totals, confirm_score=AUTO_CONFIRM_SCORE, confirm_margin=AUTO_CONFIRM_MARGIN,
+           review_score=MANUAL_REVIEW_SCORE, llm_score=LLM_REVIEW_SCORE):
+    """Top-2 margin test for every query in a candidate block.
+
+    `query[k]` is the query (e.g. new record) that candidate pair `k`
+    belongs to and `totals[k]` its score.  Pairs are sorted once by
+    (query, -score); the first pair of each run is the best candidate and
+    the next one (if any, else 0) the runner-up.
+    """
+    query = np.asarray(query)
+    totals = np.asarray(totals, dtype=np.float64)
+    if not len(query):
+        empty = np.empty(0, dtype=np.int64)
+        return Decisions(query[:0], empty, totals[:0], totals[:0], totals[:0],
+                         np.empty(0, dtype=np.int8), empty)
+
+    order = np.lexsort((-totals, query))
+    sorted_query = query[order]
+    starts = np.flatnonzero(np.r_[True, sorted_query[1:] != sorted_query[:-1]])
+    counts = np.diff(np.r_[starts, len(order)])
+
+    score = totals[order[starts]]
+    second = np.zeros_like(score)
+    has_second = counts > 1
+    second[has_second] = totals[order[starts[has_second] + 1]]
+    margin = score - second
+
+    decision = np.select(
+        [(score >= confirm_score) & (margin >= confirm_margin),
+         (score >= review_score) & (margin < confirm_margin),
+         (score >= llm_score) & (score < confirm_score)],
+        [CONFIRMED, MANUAL_REVIEW, LLM_REVIEW],
+        default=UNREGISTERED,
+    ).astype(np.int8)
+    return Decisions(sorted_query[starts], order[starts], score, second, margin, decision, counts)
+
+
+def score_block(query, signals, weights=None, **thresholds):
+    """Score a candidate block and decide every query in it.
+
+    Returns ``(totals, decisions)``; see `total_scores` and `decide`.
+    """
+    totals = total_scores(signals, weights)
+    return totals, decide(query, totals, **thresholds)
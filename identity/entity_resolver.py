@@ -0,0 +1,185 @@
+"""
+저자 엔티티 병합 (Section 22 author_identity)
+- 레코드 정수 ID 위 disjoint-set (union-find, 경로 압축), 대표 = 클러스터의 가장 작은 ID
+- Phase 3 의 "동일 저자" 쌍 판정을 배치 단위로 합쳐 전이적 클러스터 생성
+- 병합 이력(덤프, 단계, 신뢰도, 이전 대표)을 identification_log 용으로 기록
+- 월별 덤프 도착 시 ID 공간을 늘리고 이어서 병합 (.npz 저장/복원)
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+# author_identity.status
+ACTIVE = 0
+MERGED = 1
+DEPRECATED = 2
+STATUS_LABELS = ("active", "merged", "deprecated")
+
+_LOG_COLUMNS = ("batch", "raw_author_id", "other_id", "previous_identity", "other_identity",
+                "author_identity_id", "confidence")
+
+
+class EntityResolver:
+    """Union-find over record ids ``0 .. n-1``.
+
+    A record that is its own parent is an author_identity (the cluster
+    representative); every merged cluster keeps its smallest id, so an
+    identity id never changes unless it is merged into an older one.
+    """
+
+    def __init__(self, n=0):
+        self.parent = np.arange(n, dtype=np.int64)
+        self.deprecated = np.zeros(n, dtype=bool)
+        self.batches = []     # [(dump_id, algorithm_phase), ...]
+        self._log = []        # 배치별 {컬럼: 배열}
+
+    def __len__(self):
+        return len(self.parent)
+
+    def grow(self, n):
+        """Add singleton records so ids up to ``n - 1`` exist."""
+        if n > len(self):
+            self.parent = np.r_[self.parent, np.arange(len(self), n, dtype=np.int64)]
+            self.deprecated = np.r_[self.deprecated, np.zeros(n - len(self.deprecated), dtype=bool)]
+
+    def find(self, x):
+        """Representative of record `x` (compresses the path)."""
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return int(root)
+
+    def find_many(self, xs):
+        """Representatives of many records by pointer jumping (vectorized)."""
+        xs = np.asarray(xs, dtype=np.int64)
+        roots = self.parent[xs]
+        while True:
+            up = self.parent[roots]
+            if np.array_equal(up, roots):
+                break
+            roots = up
+        self.parent[xs] = roots
+        return roots
+
+    def union(self, a, b, dump_id=None, phase=None, confidence=1.0):
+        """Merge the clusters of `a` and `b`; returns the surviving identity."""
+        return int(self.union_many([a], [b], dump_id, phase, [confidence])[0])
+
+    def union_many(self, a, b, dump_id=None, phase=None, confidence=None):
+        """Merge every pair ``(a[k], b[k])`` (one batch, e.g. one Phase 3 run).
+
+        The pairs are unioned in order on a local forest over the touched
+        representatives, so the batch costs O(pairs + clusters touched).
+        Pairs that joined two distinct clusters at their turn are logged with
+        the identities the two records had at that point.  Returns the new
+        identity of each pair.
+        """
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        confidence = np.ones(len(a), dtype=np.float32) if confidence is None \
+            else np.asarray(confidence, dtype=np.float32)
+        if not len(a):
+            return a
+        self.grow(int(max(a.max(), b.max())) + 1)
+        root_a, root_b = self.find_many(a), self.find_many(b)
+
+        # 대표들을 0..m-1 로 압축 (nodes 오름차순 → 작은 인덱스 = 작은 ID = 대표)
+        nodes, inverse = np.unique(np.r_[root_a, root_b], return_inverse=True)
+        local = list(range(len(nodes)))
+
+        def find(x):
+            root = x
+            while local[root] != root:
+                root = local[root]
+            while local[x] != root:
+                local[x], x = root, local[x]
+            return root
+
+        merged = np.zeros(len(a), dtype=bool)
+        before_a = np.empty(len(a), dtype=np.int64)
+        before_b = np.empty(len(a), dtype=np.int64)
+        for k, (x, y) in enumerate(zip(inverse[:len(a)].tolist(), inverse[len(a):].tolist())):
+            # 앞선 쌍이 이미 합친 경우는 병합이 아님 (a-b, b-c 뒤의 a-c)
+            x, y = find(x), find(y)
+            if x != y:
+                merged[k] = True
+                before_a[k], before_b[k] = x, y
+                local[max(x, y)] = min(x, y)
+        new_roots = nodes[[find(x) for x in range(len(nodes))]]
+        self.parent[nodes] = new_roots
+
+        identity = new_roots[inverse[:len(a)]]
+        if merged.any():
+            self.batches.append((dump_id, phase))
+            self._log.append({
+                "batch": np.full(merged.sum(), len(self.batches) - 1, dtype=np.int32),
+                "raw_author_id": a[merged], "other_id": b[merged],
+                "previous_identity": nodes[before_a[merged]],
+                "other_identity": nodes[before_b[merged]],
+                "author_identity_id": identity[merged], "confidence": confidence[merged],
+            })
+        return identity
+
+    def deprecate(self, ids):
+        """Mark records as deprecated (e.g. soft-deleted papers' author records)."""
+        self.deprecated[np.asarray(ids, dtype=np.int64)] = True
+
+    def labels(self):
+        """Identity of every record (fully compresses the forest)."""
+        return self.find_many(np.arange(len(self), dtype=np.int64))
+
+    def status(self):
+        """author_identity.status code of every id (see `STATUS_LABELS`)."""
+        status = np.where(self.parent == np.arange(len(self)), ACTIVE, MERGED).astype(np.int8)
+        status[self.deprecated] = DEPRECATED
+        return status
+
+    def clusters(self):
+        """CSR-style clusters: ``(identities, indptr, members)``.
+
+        ``members[indptr[i]:indptr[i + 1]]`` are the record ids of identity
+        `identities[i]` (e.g. its `prtcpnt_ids[]` once mapped back).
+        """
+        labels = self.labels()
+        members = np.argsort(labels, kind="stable")
+        identities, starts = np.unique(labels[members], return_index=True)
+        return identities, np.r_[starts, len(members)], members
+
+    def identification_log(self):
+        """Merge provenance as a DataFrame shaped for `identification_log`.
+
+        One row per pair that joined two clusters: the dump and algorithm
+        phase of its batch, the resulting author_identity_id, the confidence,
+        and the identities the two records had before (previous_state).
+        """
+        if not self._log:
+            return pd.DataFrame(columns=["dump_id", "algorithm_phase", "action", *_LOG_COLUMNS[1:]])
+        frame = pd.DataFrame({c: np.concatenate([part[c] for part in self._log])
+                              for c in _LOG_COLUMNS})
+        batch = frame.pop("batch").to_numpy()
+        frame.insert(0, "dump_id", [self.batches[i][0] for i in batch])
+        frame.insert(1, "algorithm_phase", [self.batches[i][1] for i in batch])
+        frame.insert(2, "action", "merge")
+        return frame
+
+    def save(self, path):
+        log = {c: np.concatenate([part[c] for part in self._log]) if self._log else np.empty(0)
+               for c in _LOG_COLUMNS}
+        np.savez(path, parent=self.parent, deprecated=self.deprecated,
+                 batches=np.array(json.dumps(self.batches, ensure_ascii=False)),
+                 **{f"log_{c}": v for c, v in log.items()})
+
+    @classmethod
+    def load(cls, path):
+        """Restore a resolver saved with `save` (to continue with next month's dump)."""
+        with np.load(path) as data:
+            resolver = cls()
+            resolver.parent = data["parent"]
+            resolver.deprecated = data["deprecated"]
+            resolver.batches = [tuple(batch) for batch in json.loads(str(data["batches"]))]
+            if len(data["log_batch"]):
+                resolver._log = [{c: data[f"log_{c}"] for c in _LOG_COLUMNS}]
+        return resolver
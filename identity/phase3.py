@@ -0,0 +1,315 @@
+"""
+Phase 3 병렬 실행 (동명이인 구분 + 동일저자 추적)
+- 이름 블록(예: "Kim, J.")을 독립 작업 단위로 프로세스 풀에 분산
+- 후보 쌍 수 기준 LPT bin-packing, 작업자 몫보다 큰 블록은 질의 (질의가 적으면 후보) 단위로 분할
+- 공저자 CSR / 경력 구간 배열은 shared_memory, 주제 centroid 는 memmap 파일로 공유 (pickle 없음)
+- 조각 결과를 블록 순서대로 합치므로 작업자 수와 무관하게 단일 프로세스 실행과 동일
+"""
+import heapq
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from scipy import sparse
+
+from .coauthor_network import CoauthorNetwork
+from .disambiguator import Decisions, decide, total_scores
+from .temporal_tracker import CareerTimeline
+from .topic_similarity import TopicModel
+
+# key: 블록 이름, queries: 판별할 레코드(저자) ID, candidates: 후보 저자 ID
+Block = namedtuple("Block", "key queries candidates")
+
+# 한 번에 벡터화해 채점하는 후보 쌍 수 (메모리 상한)
+SHARD_BATCH_PAIRS = 1_000_000
+
+_TIMELINE_FIELDS = ("authors", "starts", "ends", "affiliations", "span_keys", "span_first",
+                    "span_last")
+
+
+class Phase3Data:
+    """Read-only inputs of Phase 3, indexed by author id.
+
+    `network`, `topics` and `timeline` may be None (the signal scores 0);
+    `query_months` / `query_affiliations` give the month index and
+    affiliation code of each query record for Signals 4 and 5.
+    """
+
+    def __init__(self, network=None, topics=None, timeline=None, query_months=None,
+                 query_affiliations=None, weights=None):
+        self.network = network
+        self.topics = topics
+        self.timeline = timeline
+        self.query_months = query_months
+        self.query_affiliations = query_affiliations
+        self.weights = weights
+
+    def signals(self, q, c):
+        """Signal columns for query/candidate pairs ``(q[k], c[k])``."""
+        signals = {}
+        if self.network is not None:
+            signals["network"] = self.network.jaccard(q, c)
+        if self.topics is not None:
+            signals["topic"] = self.topics.similarity(q, c)
+        if self.timeline is not None and self.query_months is not None:
+            affiliations = self.query_affiliations[q]
+            signals["temporal"] = self.timeline.plausibility(c, self.query_months[q], affiliations)
+            signals["meta"] = self.timeline.has_affiliation(c, affiliations).astype(np.float32)
+        return signals
+
+    def score(self, block):
+        """Decisions for the queries of one block (``best`` is a candidate id)."""
+        return self.score_many([block])[0]
+
+    def score_many(self, blocks):
+        """`score` for many blocks with one vectorized pass over all their pairs.
+
+        Small blocks dominate in number, so signals are computed for the
+        concatenated pairs and the top-2 test groups by (block, query).
+        """
+        return decide_pairs(*self.pair_totals(blocks), len(blocks))
+
+    def pair_totals(self, blocks):
+        """``(query, candidate, owner, totals)`` of every pair, owner = block position."""
+        q, c, owner = [], [], []
+        for i, block in enumerate(blocks):
+            queries = np.asarray(block.queries, dtype=np.int64)
+            candidates = np.asarray(block.candidates, dtype=np.int64)
+            bq = np.repeat(queries, len(candidates))
+            bc = np.tile(candidates, len(queries))
+            keep = bq != bc
+            q.append(bq[keep])
+            c.append(bc[keep])
+            owner.append(np.full(keep.sum(), i, dtype=np.int64))
+        q, c, owner = np.concatenate(q), np.concatenate(c), np.concatenate(owner)
+
+        signals = self.signals(q, c) if len(q) else {}
+        totals = total_scores(signals or {"network": np.zeros(len(q), dtype=np.float32)},
+                              self.weights)
+        return q, c, owner, totals
+
+
+def decide_pairs(q, c, owner, totals, n_blocks):
+    """Per-block Decisions from `Phase3Data.pair_totals` output (``best`` = candidate id)."""
+    # (블록, 질의) 단위로 1·2위 판정 후 블록별로 되돌림
+    base = int(q.max()) + 1 if len(q) else 1
+    decisions = decide(owner * base + q, totals)
+    bounds = np.searchsorted(decisions.query // base, np.arange(n_blocks + 1))
+    decisions = decisions._replace(query=decisions.query % base, best=c[decisions.best])
+    return [Decisions(*(field[lo:hi] for field in decisions))
+            for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+class SharedArrays:
+    """Copies of numpy arrays in named shared-memory segments.
+
+    `handles` is a small picklable dict ``{name: (segment, shape, dtype)}``;
+    `attach_arrays` maps them in another process without copying.  Call
+    `close()` in the owner once the workers are done.
+    """
+
+    def __init__(self, arrays):
+        self._segments = []
+        self.handles = {}
+        for name, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)[...] = arr
+            self._segments.append(shm)
+            self.handles[name] = (shm.name, arr.shape, arr.dtype.str)
+
+    def close(self):
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 작업자 프로세스 상태 (initializer 가 설정)
+_worker_segments = []
+_worker_data = None
+
+
+def attach_arrays(handles):
+    """Read-only views of arrays published by `SharedArrays` (kept mapped)."""
+    arrays = {}
+    for name, (segment, shape, dtype) in handles.items():
+        shm = shared_memory.SharedMemory(name=segment)
+        _worker_segments.append(shm)
+        arr = np.ndarray(shape, np.dtype(dtype), buffer=shm.buf)
+        arr.flags.writeable = False
+        arrays[name] = arr
+    return arrays
+
+
+def _shared_inputs(data):
+    """(arrays to publish, picklable spec) for a `Phase3Data`."""
+    arrays, spec = {}, {"weights": data.weights}
+    if data.network is not None:
+        m = data.network.matrix
+        arrays.update(csr_data=m.data, csr_indices=m.indices, csr_indptr=m.indptr)
+        spec["csr_shape"] = m.shape
+    if data.timeline is not None:
+        arrays.update({f"timeline_{f}": getattr(data.timeline, f) for f in _TIMELINE_FIELDS})
+    if data.query_months is not None:
+        arrays.update(query_months=data.query_months, query_affiliations=data.query_affiliations)
+    # TopicModel 은 centroids 파일을 각 작업자가 memmap 으로 열어 공유 (run_phase3 가 먼저 save())
+    spec["topic_dir"] = data.topics.directory if data.topics is not None else None
+    return arrays, spec
+
+
+def _init_worker(handles, spec):
+    global _worker_data
+    arrays = attach_arrays(handles)
+    network = timeline = None
+    if "csr_shape" in spec:
+        network = CoauthorNetwork(sparse.csr_matrix(
+            (arrays["csr_data"], arrays["csr_indices"], arrays["csr_indptr"]),
+            shape=spec["csr_shape"]))
+    if "timeline_authors" in arrays:
+        timeline = CareerTimeline(*(arrays[f"timeline_{f}"] for f in _TIMELINE_FIELDS))
+    topics = TopicModel(spec["topic_dir"]) if spec["topic_dir"] else None
+    _worker_data = Phase3Data(network, topics, timeline, arrays.get("query_months"),
+                              arrays.get("query_affiliations"), spec["weights"])
+
+
+def _run_shard(blocks, shard, data=None):
+    """Score one shard: [(block index, query start, stop, candidate start, stop), ...].
+
+    Pieces holding all of a block's candidates come back as Decisions
+    (``(index, query start, Decisions)``), scored `SHARD_BATCH_PAIRS`
+    candidate pairs at a time.  Candidate slices come back as pair totals
+    (``(index, candidate start, (q, c, totals))``); the top-2 test needs the
+    whole candidate list, so `run_phase3` decides those after merging.
+    """
+    data = data or _worker_data
+    out, partial, batch, pairs = [], [], [], 0
+    for index, q_start, q_stop, c_start, c_stop in shard:
+        block = blocks[index]
+        piece = block._replace(queries=block.queries[q_start:q_stop],
+                               candidates=block.candidates[c_start:c_stop])
+        if c_stop - c_start < len(block.candidates):
+            q, c, _, totals = data.pair_totals([piece])
+            partial.append((index, c_start, (q, c, totals)))
+            continue
+        batch.append((index, q_start, piece))
+        pairs += (q_stop - q_start) * len(block.candidates)
+        if pairs >= SHARD_BATCH_PAIRS:
+            out += _score_batch(data, batch)
+            batch, pairs = [], 0
+    return out + _score_batch(data, batch), partial
+
+
+def _score_batch(data, batch):
+    if not batch:
+        return []
+    decisions = data.score_many([block for _, _, block in batch])
+    return [(index, start, d) for (index, start, _), d in zip(batch, decisions)]
+
+
+def block_cost(block):
+    """Estimated work of a block: number of candidate pairs."""
+    return len(block.queries) * len(block.candidates)
+
+
+def _slices(n, parts):
+    bounds = np.linspace(0, n, min(max(parts, 1), max(n, 1)) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def plan_shards(blocks, workers):
+    """Pack blocks into `workers` shards of similar total cost (LPT).
+
+    Blocks costing more than an even share are first split, so a giant
+    block ("Kim, J.") cannot leave one worker running long after the
+    others: into query slices when it has enough queries, otherwise into
+    candidate slices.  Returns lists of
+    (block, query start, query stop, candidate start, candidate stop).
+    """
+    costs = [block_cost(b) for b in blocks]
+    share = max(sum(costs) / max(workers, 1), 1)
+    pieces = []
+    for index, (block, cost) in enumerate(zip(blocks, costs)):
+        n_queries, n_candidates = len(block.queries), len(block.candidates)
+        parts = max(int(np.ceil(cost / share)), 1)
+        if parts <= n_queries:
+            cuts = [(qs, qe, 0, n_candidates) for qs, qe in _slices(n_queries, parts)]
+        else:
+            # 질의가 적은 큰 블록 (예: 새 레코드 1건 × 후보 수만 명) → 후보 단위로 분할
+            cuts = [(0, n_queries, cs, ce) for cs, ce in _slices(n_candidates, parts)]
+        for qs, qe, cs, ce in cuts:
+            pieces.append(((qe - qs) * (ce - cs), index, qs, qe, cs, ce))
+
+    # 비용 큰 조각부터 가장 가벼운 shard 에 배정
+    pieces.sort(key=lambda p: (-p[0],) + p[1:])
+    heap = [(0, i) for i in range(max(workers, 1))]
+    shards = [[] for _ in heap]
+    for cost, *piece in pieces:
+        load, i = heapq.heappop(heap)
+        shards[i].append(tuple(piece))
+        heapq.heappush(heap, (load + cost, i))
+    return [s for s in shards if s]
+
+
+def _concat(parts):
+    return Decisions(*(np.concatenate(field) for field in zip(*parts)))
+
+
+def run_phase3(blocks, data, workers=1):
+    """Score every block; returns ``[(block.key, Decisions), ...]`` in block order.
+
+    `workers` > 1 runs shards from `plan_shards` in a process pool (0 = CPU
+    count); shared inputs are published once through shared memory.
+    Workers open the topic model from its directory, so the caller must
+    `save()` it first; scoring itself never writes to disk.
+    """
+    # 질의를 정렬해 두어야 분할 결과를 이어 붙인 순서가 단일 실행과 같음
+    blocks = [b._replace(queries=np.unique(np.asarray(b.queries, dtype=np.int64))) for b in blocks]
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    shards = plan_shards(blocks, workers) if workers > 1 else []
+    if len(shards) <= 1:
+        results, partial = _run_shard(
+            blocks, [(i, 0, len(b.queries), 0, len(b.candidates)) for i, b in enumerate(blocks)],
+            data)
+    else:
+        if data.topics is not None and data.topics.dirty:
+            # 작업자는 디스크의 TopicModel 을 열므로 저장되지 않은 변경이 있으면 결과가 달라짐
+            raise ValueError("병렬 실행 전에 topics.save() 로 주제 모델을 저장해야 합니다")
+        arrays, spec = _shared_inputs(data)
+        with SharedArrays(arrays) as shared, ProcessPoolExecutor(
+                max_workers=len(shards), initializer=_init_worker,
+                initargs=(shared.handles, spec)) as pool:
+            # 각 shard 에는 자신이 맡은 블록만 넘김
+            futures = [pool.submit(_run_shard, {piece[0]: blocks[piece[0]] for piece in shard},
+                                   shard)
+                       for shard in shards]
+            results, partial = [], []
+            for f in futures:
+                done, totals = f.result()
+                results += done
+                partial += totals
+
+    # 후보 단위로 나뉜 블록: 조각을 후보 순서대로 합친 뒤 1·2위 판정
+    by_candidates = {}
+    for index, start, pairs in sorted(partial, key=lambda r: (r[0], r[1])):
+        by_candidates.setdefault(index, []).append(pairs)
+    for index, parts in by_candidates.items():
+        q, c, totals = (np.concatenate(field) for field in zip(*parts))
+        # 단일 실행과 같은 (질의, 후보) 순서로 정렬 (decide 의 동점 처리가 순서에 의존)
+        order = np.argsort(q, kind="stable")
+        q, c, totals = q[order], c[order], totals[order]
+        results.append((index, 0, decide_pairs(q, c, np.zeros(len(q), dtype=np.int64), totals, 1)[0]))
+
+    by_block = [[] for _ in blocks]
+    for index, start, decisions in sorted(results, key=lambda r: (r[0], r[1])):
+        by_block[index].append(decisions)
+    return [(block.key, _concat(parts)) for block, parts in zip(blocks, by_block)]
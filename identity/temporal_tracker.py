@@ -0,0 +1,166 @@
+"""
+시계열 경력 추적 (Signal 4)
+- 저자별 소속 이력을 발행월(PBLC_YM) 순 소속 구간(run)으로 압축해 정렬 배열에 보관
+- (저자, 월) 합성 키 searchsorted 로 후보마다 O(log n) 조회 (이력 전체 재탐색 없음)
+- 새 논문의 (월, 소속)이 기존 이력 사이에 시간순으로 자연스러운지 점수화
+"""
+import re
+
+import numpy as np
+
+MISSING = -1
+# 월 인덱스(연*12 + 월-1)와 소속 코드를 저자 ID와 합친 정렬 키
+_MONTH_BITS = 20
+_AFFILIATION_BITS = 31
+
+# 소속 변경 타당성 점수
+TEMPORAL_SCORES = {
+    "same": 1.0,          # 해당 시점 소속과 일치
+    "concurrent": 0.9,    # 같은 기간에 이미 보유한 다른 소속 (겸직)
+    "adjacent": 0.9,      # 이력 사이/앞: 직전 또는 직후 소속과 일치
+    "move": 0.8,          # 마지막 소속 이후 새 기관으로 이동
+    "before": 0.6,        # 첫 기록 이전의 다른 소속
+    "return": 0.6,        # 과거 소속으로 복귀
+    "unknown": 0.5,       # 이력 또는 소속 정보 없음
+    "interlude": 0.4,     # 이력 사이에 끼어든 처음 보는 소속
+    "conflict": 0.3,      # 같은 시기에 전혀 다른 소속에서 활동
+}
+# 활동 공백이 이보다 길면 점수를 절반으로
+MAX_GAP_MONTHS = 120
+# 게재 지연 등으로 소속 기간 앞뒤를 이만큼 겹쳐도 겸직으로 봄
+TRANSITION_MONTHS = 12
+
+
+def month_index(yyyymm):
+    """YYYYMM (int or str, extra characters ignored) -> year * 12 + month - 1."""
+    values = np.atleast_1d(np.asarray(yyyymm))
+    if values.dtype.kind in "OUS":
+        digits = [re.sub(r"\D", "", str(v))[:6] for v in values.ravel()]
+        values = np.array([int(d) if len(d) == 6 else MISSING for d in digits])
+    values = values.astype(np.int64)
+    out = values // 100 * 12 + values % 100 - 1
+    out[values < 0] = MISSING
+    return out
+
+
+class CareerTimeline:
+    """Per-author affiliation runs in CSR-like sorted arrays.
+
+    Run `r` covers months ``[starts[r], ends[r]]`` at `affiliations[r]` for
+    `authors[r]`; runs are sorted by (author, start).  `span_*` hold the
+    first and last month of every (author, affiliation) pair for dual or
+    returning affiliations.
+    """
+
+    def __init__(self, authors, starts, ends, affiliations, span_keys, span_first, span_last):
+        self.authors = authors
+        self.starts = starts
+        self.ends = ends
+        self.affiliations = affiliations
+        self.span_keys = span_keys
+        self.span_first = span_first
+        self.span_last = span_last
+        self._run_keys = (authors << _MONTH_BITS) | starts
+
+    def __len__(self):
+        return len(self.starts)
+
+    @classmethod
+    def from_records(cls, author_ids, months, affiliations):
+        """Build from one record per (author, paper): month index and affiliation code.
+
+        Records with a missing author, month or affiliation are ignored.
+        """
+        author_ids = np.asarray(author_ids, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        affiliations = np.asarray(affiliations, dtype=np.int64)
+        valid = (author_ids >= 0) & (months >= 0) & (affiliations >= 0)
+        author_ids, months, affiliations = author_ids[valid], months[valid], affiliations[valid]
+
+        order = np.lexsort((affiliations, months, author_ids))
+        a, m, f = author_ids[order], months[order], affiliations[order]
+        # 같은 저자에서 소속이 이어지는 레코드를 하나의 구간으로 합침
+        new_run = np.r_[True, (a[1:] != a[:-1]) | (f[1:] != f[:-1])]
+        starts_at = np.flatnonzero(new_run)
+        ends_at = np.r_[starts_at[1:], len(a)] - 1
+
+        span_keys = (a << _AFFILIATION_BITS) | f
+        span_order = np.argsort(span_keys, kind="stable")
+        span_keys = span_keys[span_order]
+        first_at = np.flatnonzero(np.r_[True, span_keys[1:] != span_keys[:-1]])
+        last_at = np.r_[first_at[1:], len(span_keys)] - 1
+        return cls(a[starts_at], m[starts_at], m[ends_at], f[starts_at],
+                   span_keys[first_at], m[span_order][first_at], m[span_order][last_at])
+
+    def history(self, author):
+        """[(start, end, affiliation), ...] of one author, oldest first."""
+        lo, hi = np.searchsorted(self._run_keys, [author << _MONTH_BITS, (author + 1) << _MONTH_BITS])
+        return list(zip(self.starts[lo:hi].tolist(), self.ends[lo:hi].tolist(),
+                        self.affiliations[lo:hi].tolist()))
+
+    def _span(self, author_ids, affiliations):
+        """(found, first, last) of each (author, affiliation) pair."""
+        keys = (author_ids << _AFFILIATION_BITS) | np.maximum(affiliations, 0)
+        pos = np.minimum(np.searchsorted(self.span_keys, keys), max(len(self.span_keys) - 1, 0))
+        if not len(self.span_keys):
+            return np.zeros(len(keys), dtype=bool), pos, pos
+        found = (self.span_keys[pos] == keys) & (affiliations >= 0)
+        return found, self.span_first[pos], self.span_last[pos]
+
+    def has_affiliation(self, author_ids, affiliations):
+        """True where the author has ever published under the affiliation."""
+        return self._span(np.asarray(author_ids, dtype=np.int64),
+                          np.asarray(affiliations, dtype=np.int64))[0]
+
+    def plausibility(self, author_ids, months, affiliations):
+        """Signal 4 score for candidate author `author_ids[k]` of a paper at
+        `months[k]` with affiliation `affiliations[k]` (float32 array).
+
+        Each candidate costs two binary searches: the run at or before the
+        month (and the one after it), and the (author, affiliation) span.
+        """
+        a = np.asarray(author_ids, dtype=np.int64)
+        m = np.asarray(months, dtype=np.int64)
+        f = np.asarray(affiliations, dtype=np.int64)
+        scores = np.full(len(a), TEMPORAL_SCORES["unknown"], dtype=np.float32)
+        if not len(self) or not len(a):
+            return scores
+
+        # 월 이전에 시작한 마지막 구간(prev)과 그다음 구간(nxt)
+        pos = np.searchsorted(self._run_keys, (a << _MONTH_BITS) | np.maximum(m, 0), side="right") - 1
+        prev = np.maximum(pos, 0)
+        has_prev = (pos >= 0) & (self.authors[prev] == a)
+        nxt = np.minimum(pos + 1, len(self) - 1)
+        has_next = (pos + 1 < len(self)) & (self.authors[nxt] == a)
+        known = (has_prev | has_next) & (m >= 0) & (f >= 0)
+
+        in_span, first, last = self._span(a, f)
+        inside = has_prev & (m <= self.ends[prev])
+        after = has_prev & ~inside & ~has_next
+        between = has_prev & ~inside & has_next
+        before = ~has_prev & has_next
+        same_prev = f == self.affiliations[prev]
+        same_next = f == self.affiliations[nxt]
+        concurrent = in_span & (first - TRANSITION_MONTHS <= m) & (m <= last + TRANSITION_MONTHS)
+
+        conditions = [
+            inside & same_prev,
+            inside & concurrent,
+            inside,
+            after & same_prev,
+            (between & (same_prev | same_next)) | (before & same_next),
+            (after | between) & in_span,
+            after,
+            between,
+            before,
+        ]
+        choices = [TEMPORAL_SCORES[k] for k in
+                   ("same", "concurrent", "conflict", "same", "adjacent", "return", "move",
+                    "interlude", "before")]
+        scores[known] = np.select([c[known] for c in conditions], choices,
+                                  default=TEMPORAL_SCORES["unknown"])
+
+        # 직전 활동과의 공백이 너무 긴 경우 감점
+        gap = np.where(has_prev, m - self.ends[prev], np.where(has_next, self.starts[nxt] - m, 0))
+        scores[known & (gap > MAX_GAP_MONTHS)] *= 0.5
+        return scores
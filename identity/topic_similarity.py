@@ -0,0 +1,249 @@
+"""
+연구 주제 유사도 (Signal 3)
+- 논문 제목(ORG_LANG_PPR_NM) + 초록(ABST_CNTN) → HashingVectorizer (어휘 적합 불필요)
+- 문서 빈도(DF)를 누적해 IDF를 증분 갱신
+- 저자별 TF 합을 float32 memmap 행렬로 보관, 새 논문이 닿은 저자 행만 갱신
+- 코사인 = 조회 시점 IDF 가중 후 정규화한 행 사이의 내적 (배치 행렬곱)
+- memmap 을 직접 고치므로 save() 전의 변경은 되돌림 기록(undo/)에 남기고, 저장 전에 중단되면
+  다음 로드 때 마지막 save() 상태로 복원 (재실행 시 같은 논문을 두 번 더하지 않음)
+"""
+import json
+import os
+import shutil
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+DEFAULT_FEATURES = 1 << 14
+# 형태소 분석기 없이 한글/영문 모두 쓸 수 있는 문자 n-gram
+ANALYZER = "char_wb"
+NGRAM_RANGE = (2, 3)
+# 쌍 비교 시 한 번에 펼치는 밀집 행 수 (2 x 4096 x 16384 x 4B ≈ 512MB)
+DEFAULT_BATCH = 4096
+
+_META = "meta.json"
+_DF = "df.npy"
+_COUNTS = "paper_counts.npy"
+_CENTROIDS = "centroids.f32"
+_JOURNAL = "undo"
+_JOURNAL_STATE = "state.npz"
+
+
+def _atomic_savez(path, **arrays):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
+def _write_state(directory, n_features, n_docs, df, paper_counts):
+    """Write DF, paper counts and meta.json (meta last)."""
+    np.save(os.path.join(directory, _DF), df)
+    np.save(os.path.join(directory, _COUNTS), paper_counts)
+    meta = {"n_features": int(n_features), "n_docs": int(n_docs),
+            "analyzer": ANALYZER, "ngram_range": list(NGRAM_RANGE)}
+    tmp = os.path.join(directory, _META + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(directory, _META))
+
+
+def _rollback(directory):
+    """Restore the last saved state from an undo journal left by an unsaved run."""
+    journal = os.path.join(directory, _JOURNAL)
+    state_path = os.path.join(journal, _JOURNAL_STATE)
+    # 상태 스냅숏이 없으면 memmap 을 고치기 전에 중단된 것
+    if os.path.exists(state_path):
+        with np.load(state_path) as state:
+            n_features, n_docs = int(state["n_features"]), int(state["n_docs"])
+            df, paper_counts = state["df"], state["paper_counts"]
+        path = os.path.join(directory, _CENTROIDS)
+        n_authors = len(paper_counts)
+        if n_authors and os.path.exists(path):
+            centroids = np.memmap(path, dtype=np.float32, mode="r+", shape=(n_authors, n_features))
+            # 같은 행이 여러 번 기록됐으면 가장 앞선 기록(저장 시점 값)이 마지막에 적용되게 역순
+            for name in sorted(os.listdir(journal), reverse=True):
+                if name.startswith("rows-") and name.endswith(".npz"):
+                    with np.load(os.path.join(journal, name)) as rows:
+                        centroids[rows["ids"]] = rows["rows"]
+            centroids.flush()
+            del centroids
+        if os.path.exists(path):
+            # 저장 후 늘어난 행 제거 (다시 늘릴 때 0 으로 채워짐)
+            with open(path, "ab") as f:
+                f.truncate(n_authors * n_features * 4)
+        _write_state(directory, n_features, n_docs, df, paper_counts)
+    shutil.rmtree(journal)
+
+
+class TopicModel:
+    """Hashed TF-IDF author profiles stored in `directory`.
+
+    `centroids[a]` is the sum of the L2-normalized term-frequency vectors
+    of author `a`'s papers.  IDF is not baked in, so a monthly DF update
+    never forces a rewrite of untouched rows; it is applied when scoring.
+    """
+
+    def __init__(self, directory, n_features=DEFAULT_FEATURES):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        if os.path.isdir(os.path.join(directory, _JOURNAL)):
+            _rollback(directory)
+        meta_path = os.path.join(directory, _META)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            self.n_features = meta["n_features"]
+            self.n_docs = meta["n_docs"]
+            self.df = np.load(os.path.join(directory, _DF))
+            self.paper_counts = np.load(os.path.join(directory, _COUNTS))
+        else:
+            self.n_features = n_features
+            self.n_docs = 0
+            self.df = np.zeros(n_features, dtype=np.int64)
+            self.paper_counts = np.zeros(0, dtype=np.int32)
+        self.vectorizer = HashingVectorizer(
+            n_features=self.n_features, analyzer=ANALYZER, ngram_range=NGRAM_RANGE,
+            alternate_sign=False, norm=None,
+        )
+        self.centroids = self._map(len(self.paper_counts))
+        self._journal = None    # save() 이후 기록한 행 청크 수 (None: 변경 없음)
+        self._saved_authors = len(self.paper_counts)
+
+    def __len__(self):
+        return len(self.paper_counts)
+
+    @property
+    def dirty(self):
+        """Whether there are changes not yet written by `save`."""
+        return self._journal is not None
+
+    def _begin(self):
+        """Snapshot the saved state before the first change since `save`."""
+        if self._journal is not None:
+            return
+        journal = os.path.join(self.directory, _JOURNAL)
+        os.makedirs(journal, exist_ok=True)
+        _atomic_savez(os.path.join(journal, _JOURNAL_STATE), n_features=self.n_features,
+                      n_docs=self.n_docs, df=self.df, paper_counts=self.paper_counts)
+        self._journal = 0
+        self._saved_authors = len(self)
+
+    def _record(self, ids):
+        """Journal the current values of rows `ids` before they are overwritten."""
+        ids = ids[ids < self._saved_authors]
+        if not len(ids):
+            return
+        name = f"rows-{self._journal:08d}.npz"
+        _atomic_savez(os.path.join(self.directory, _JOURNAL, name), ids=ids,
+                      rows=np.asarray(self.centroids[ids]))
+        self._journal += 1
+
+    def _map(self, n_authors):
+        path = os.path.join(self.directory, _CENTROIDS)
+        if n_authors == 0:
+            return np.zeros((0, self.n_features), dtype=np.float32)
+        return np.memmap(path, dtype=np.float32, mode="r+", shape=(n_authors, self.n_features))
+
+    def _grow(self, n_authors):
+        """Extend the centroid file to `n_authors` rows (new rows are zero)."""
+        if n_authors <= len(self):
+            return
+        if isinstance(self.centroids, np.memmap):
+            self.centroids.flush()
+        path = os.path.join(self.directory, _CENTROIDS)
+        with open(path, "ab") as f:
+            f.truncate(n_authors * self.n_features * 4)
+        counts = np.zeros(n_authors, dtype=np.int32)
+        counts[:len(self.paper_counts)] = self.paper_counts
+        self.paper_counts = counts
+        self.centroids = self._map(n_authors)
+
+    @property
+    def idf(self):
+        """Smoothed IDF over every paper added so far (as in scikit-learn)."""
+        return (np.log((1 + self.n_docs) / (1 + self.df)) + 1).astype(np.float32)
+
+    def transform(self, texts):
+        """L2-normalized hashed term frequencies (sparse, one row per text)."""
+        return normalize(self.vectorizer.transform(texts).astype(np.float32))
+
+    def add_papers(self, texts, record_papers, record_authors, batch_size=DEFAULT_BATCH):
+        """Add new papers and fold them into their authors' centroids.
+
+        `texts[p]` is title + abstract of paper `p`; each record
+        ``(record_papers[k], record_authors[k])`` credits paper to author.
+        Rows are updated `batch_size` authors at a time; the old rows are
+        journaled first, so until `save` the change can be rolled back.
+        Returns the sorted ids of the authors whose rows changed.
+        """
+        self._begin()
+        tf = self.transform(texts)
+        self.df += np.bincount(tf.indices, minlength=self.n_features)
+        self.n_docs += tf.shape[0]
+
+        record_papers = np.asarray(record_papers, dtype=np.int64)
+        record_authors = np.asarray(record_authors, dtype=np.int64)
+        valid = record_authors >= 0
+        record_papers, record_authors = record_papers[valid], record_authors[valid]
+        if not len(record_authors):
+            return record_authors
+        self._grow(int(record_authors.max()) + 1)
+
+        touched, rows = np.unique(record_authors, return_inverse=True)
+        credit = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, record_papers)),
+            shape=(len(touched), tf.shape[0]),
+        )
+        gain = (credit @ tf).tocsr()
+        # 밀집 행은 청크 단위로만 펼침 (대량 증분에서도 memmap 밖 메모리는 batch_size 행)
+        for start in range(0, len(touched), batch_size):
+            end = start + batch_size
+            self._record(touched[start:end])
+            self.centroids[touched[start:end]] += gain[start:end].toarray()
+        self.paper_counts += np.bincount(record_authors, minlength=len(self)).astype(np.int32)
+        return touched
+
+    def save(self):
+        """Persist DF / counts / meta, then drop the undo journal (the commit point)."""
+        if isinstance(self.centroids, np.memmap):
+            self.centroids.flush()
+        _write_state(self.directory, self.n_features, self.n_docs, self.df, self.paper_counts)
+        shutil.rmtree(os.path.join(self.directory, _JOURNAL), ignore_errors=True)
+        self._journal = None
+        self._saved_authors = len(self)
+
+    def profiles(self, authors):
+        """IDF-weighted, L2-normalized centroid rows (dense float32).
+
+        Authors without any paper yet (ids past the last row) get zero rows.
+        """
+        authors = np.asarray(authors, dtype=np.int64)
+        # MISSING(-1) 등 음수 ID 는 미확인 후보 → 0 행 (음수 인덱스로 마지막 저자 행을 읽지 않게)
+        known = (authors >= 0) & (authors < len(self))
+        rows = np.zeros((len(authors), self.n_features), dtype=np.float32)
+        rows[known] = self.centroids[authors[known]]
+        rows *= self.idf
+        return normalize(rows, copy=False)
+
+    def similarity(self, a, b, batch_size=DEFAULT_BATCH):
+        """Cosine similarity for each author pair ``(a[k], b[k])``."""
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        out = np.empty(len(a), dtype=np.float32)
+        for start in range(0, len(a), batch_size):
+            end = start + batch_size
+            out[start:end] = np.einsum("ij,ij->i", self.profiles(a[start:end]),
+                                       self.profiles(b[start:end]))
+        return out
+
+    def score(self, texts, candidates):
+        """Cosine of each new paper against a candidate author list.
+
+        Returns a ``(len(texts), len(candidates))`` matrix computed with one
+        sparse x dense product.
+        """
+        query = normalize(self.transform(texts).multiply(self.idf).tocsr())
+        return np.asarray(query @ self.profiles(candidates).T, dtype=np.float32)
@@ -0,0 +1,4 @@
+"""
+LLM 2차 판별 (하이브리드 엔진)
+- anthropic SDK 는 실제 API 호출 경로에서만 import
+"""
@@ -0,0 +1,319 @@
+"""
+하이브리드 오케스트레이터 (Section 10.1)
+- 1차 수학 모델에서 자동 확정되지 않은 케이스(신뢰도 < 0.7, ~30%)만 2차 LLM 으로 이관
+- asyncio 디스패처: 동시 요청 수 제한, 토큰 버킷 속도 제한(요청/분, 입력 토큰/분),
+  지터 지수 백오프 재시도, 입력 순서대로 결과 수집
+- 응답 캐시(ResponseCache)가 있으면 적중한 요청은 API 호출 없이 반환
+- 교차 검증: 수학 1위와 LLM 판단 일치 → 확정, 불일치 → 수동 검토
+"""
+import asyncio
+import random
+import time
+from collections import namedtuple
+
+from config import (
+    AUTO_CONFIRM_SCORE, LLM_CONCURRENCY, LLM_INPUT_TOKENS_PER_MINUTE, LLM_MAX_RETRIES,
+    LLM_REQUESTS_PER_MINUTE,
+)
+from identity.disambiguator import CONFIRMED, MANUAL_REVIEW, UNREGISTERED
+
+from .llm_classifier import LLMAuthorClassifier
+from .llm_disambiguator import LLMDisambiguator
+from .prompt_packing import Paper
+from .prompt_templates import complete_json, request_tokens
+from .routing import LLM, MANUAL
+
+# 재시도 대상 HTTP 상태 (5xx 포함, 그 외 4xx 는 즉시 실패)
+RETRY_STATUS = {408, 409, 429}
+
+# index: 입력 순서, response: Message 또는 캐시된 dict (실패 시 None), error: 마지막 예외,
+# attempts: API 호출 횟수 (캐시 적중 시 0)
+Outcome = namedtuple("Outcome", "index response error attempts")
+
+# 동명이인 케이스: 1차 수학 모델 결과(Decisions 한 행)와 LLM 프롬프트용 정보
+# math_margin: 1·2위 차이, coverage: 최선 후보의 0 아닌 신호 수 (routing.signal_coverage, 없으면 None)
+HomonymCase = namedtuple("HomonymCase", "key name candidates new_paper math_best math_score "
+                         "math_decision math_margin coverage", defaults=(None, None))
+# 역할 판별 케이스: 1차 의사결정 트리 결과와 PDF 텍스트
+RoleCase = namedtuple("RoleCase", "key pdf_text api_data math_authors math_confidence ocr")
+
+# source: "math" / "llm" / "error" / "router" (라우팅 규칙으로 수동 검토, evidence = 규칙 이름)
+Resolution = namedtuple("Resolution", "key author_id confidence decision source evidence")
+RoleResult = namedtuple("RoleResult", "key authors source error")
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursts up to `capacity`.
+
+    Waiters are served in arrival order.  A request larger than the whole
+    bucket waits for a full bucket and drains it (it can never fit, so this
+    is the closest the limit can get); smaller requests pay their full cost.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount=1):
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+def make_async_client(base_url=None, api_key=None):
+    """AsyncAnthropic without SDK retries (the dispatcher retries itself)."""
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic(base_url=base_url, api_key=api_key, max_retries=0)
+
+
+def cacheable(response, validate=None, index=None):
+    """Whether a response is worth caching: complete and accepted by `validate`.
+
+    `validate(index, response)` is the caller's parser and raises ValueError
+    on a bad answer; without it the response must be complete JSON.
+    """
+    try:
+        if validate is None:
+            complete_json(response)
+        else:
+            validate(index, response)
+    except ValueError:
+        return False
+    return True
+
+
+def _retryable(error):
+    from anthropic import APIConnectionError, APIStatusError
+
+    if isinstance(error, APIStatusError):
+        return error.status_code in RETRY_STATUS or error.status_code >= 500
+    return isinstance(error, APIConnectionError)
+
+
+def _retry_after(error):
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after", 0)) if response is not None else 0.0
+    except ValueError:
+        return 0.0
+
+
+class AsyncDispatcher:
+    """Send many messages.create requests concurrently.
+
+    At most `concurrency` requests are in flight; request and estimated
+    input-token rates are capped per minute with token buckets; retryable
+    failures (429, 5xx, connection errors) back off exponentially with full
+    jitter, honouring retry-after.  Results come back in input order.
+    With a `cache`, hits are answered locally and only responses that pass
+    validation are stored (see `cacheable`).
+    """
+
+    def __init__(self, client=None, concurrency=LLM_CONCURRENCY,
+                 requests_per_minute=LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute=LLM_INPUT_TOKENS_PER_MINUTE, max_retries=LLM_MAX_RETRIES,
+                 backoff=1.0, max_backoff=60.0, seed=None, cache=None):
+        self.client = client
+        self.cache = cache
+        self.concurrency = concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._random = random.Random(seed)
+        self.stats = {"requests": 0, "retries": 0, "failures": 0, "cached": 0}
+        self._loop = None
+
+    def _delay(self, error, attempt):
+        """Full-jitter exponential backoff, at least the server's retry-after."""
+        jitter = self._random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        return max(jitter, _retry_after(error))
+
+    async def _send(self, client, limits, index, request):
+        semaphore, request_bucket, token_bucket = limits
+        tokens = request_tokens(request)
+        attempts = 0
+        while True:
+            async with semaphore:
+                await request_bucket.acquire()
+                await token_bucket.acquire(tokens)
+                attempts += 1
+                self.stats["requests"] += 1
+                try:
+                    return Outcome(index, await client.messages.create(**request), None, attempts)
+                except Exception as e:
+                    # API 오류 외(응답 파싱, 클라이언트 버그 등)도 이 케이스의 실패로 기록
+                    error = e
+            if attempts > self.max_retries or not _retryable(error):
+                self.stats["failures"] += 1
+                return Outcome(index, None, error, attempts)
+            self.stats["retries"] += 1
+            await asyncio.sleep(self._delay(error, attempts - 1))
+
+    async def run(self, requests, validate=None):
+        """Dispatch `requests` (messages.create kwargs); one `Outcome` each, in order.
+
+        `validate(index, response)` decides which responses are cached; a
+        cached entry it rejects is requested again.
+        """
+        requests = list(requests)
+        outcomes = [None] * len(requests)
+        pending = []
+        for i, request in enumerate(requests):
+            cached = self.cache.get(request) if self.cache is not None else None
+            if cached is None or not cacheable(cached, validate, i):
+                pending.append(i)
+            else:
+                outcomes[i] = Outcome(i, cached, None, 0)
+                self.stats["cached"] += 1
+        if not pending:
+            return outcomes
+
+        if self.client is None:
+            self.client = make_async_client()
+        client = self.client
+        limits = (
+            asyncio.Semaphore(self.concurrency),
+            TokenBucket(self.requests_per_minute / 60, max(self.requests_per_minute / 60, 1)),
+            # 입력 토큰: 분당 예산 전체를 버킷으로, 초당 tokens_per_minute / 60 씩 보충
+            TokenBucket(self.tokens_per_minute / 60, self.tokens_per_minute),
+        )
+        sent = await asyncio.gather(*(self._send(client, limits, i, requests[i]) for i in pending),
+                                    return_exceptions=True)
+        for i, outcome in zip(pending, sent):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                # 한 케이스의 예외가 나머지 요청을 취소하지 않게 실패로 기록
+                self.stats["failures"] += 1
+                outcome = Outcome(i, None, outcome, 0)
+            outcomes[outcome.index] = outcome
+            # 잘린 응답이나 파싱에 실패한 응답은 캐시하지 않음 (TTL 동안 재사용 방지)
+            if (self.cache is not None and outcome.error is None
+                    and cacheable(outcome.response, validate, outcome.index)):
+                self.cache.put(requests[outcome.index], outcome.response)
+        return outcomes
+
+    def dispatch(self, requests, validate=None):
+        """Synchronous wrapper around `run`.
+
+        Every call runs on the dispatcher's own event loop: the async client's
+        pooled connections are bound to the loop that opened them.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.run(requests, validate))
+
+    def close(self):
+        if self._loop is not None:
+            if self.client is not None:
+                self._loop.run_until_complete(self.client.close())
+            self._loop.close()
+            self._loop = None
+
+
+class HybridEngine:
+    """Math model first, LLM for the cases it could not confirm."""
+
+    def __init__(self, disambiguator=None, classifier=None, dispatcher=None,
+                 threshold=AUTO_CONFIRM_SCORE, packer=None, router=None):
+        self.disambiguator = disambiguator or LLMDisambiguator()
+        self.classifier = classifier or LLMAuthorClassifier()
+        self.dispatcher = dispatcher or AsyncDispatcher()
+        self.threshold = threshold
+        # PackedRoleClassifier: 역할 판별을 여러 논문씩 묶어 요청 (OCR 케이스는 개별 요청)
+        self.packer = packer
+        # RoutingPolicy: 동명이인 케이스 중 LLM 이 개선할 수 있는 것만 이관 (없으면 자동 확정 외 전부)
+        self.router = router
+        self.routing = None
+
+    def _dispatch(self, requests, validate=None):
+        return self.dispatcher.dispatch(requests, validate) if requests else []
+
+    def disambiguate(self, cases):
+        """Resolve homonym cases; returns one `Resolution` per case, in order."""
+        cases = list(cases)
+        # 라우터가 있으면 규칙이 어떤 케이스든 이관할 수 있으므로 전부 요청을 만듦
+        requests = [self.disambiguator.request(c.name, c.candidates, c.new_paper)
+                    if self.router is not None or c.math_decision != CONFIRMED else None
+                    for c in cases]
+        results = [Resolution(c.key, c.math_best, c.math_score, c.math_decision, "math", "")
+                   for c in cases]
+        if self.router is None:
+            pending = [i for i, request in enumerate(requests) if request is not None]
+        else:
+            self.routing = self.router.plan(cases, requests, getattr(self.dispatcher, "cache", None))
+            pending = self.routing.indices(LLM)
+            for i in self.routing.indices(MANUAL):
+                c = cases[i]
+                results[i] = Resolution(c.key, c.math_best, c.math_score, MANUAL_REVIEW, "router",
+                                        self.routing.routes[i].rule)
+        outcomes = self._dispatch([requests[i] for i in pending],
+                                  lambda k, r: self.disambiguator.parse(r, cases[pending[k]].candidates))
+        for i, outcome in zip(pending, outcomes):
+            results[i] = self._cross_check(cases[i], outcome)
+        return results
+
+    def _cross_check(self, case, outcome):
+        """Combine the math decision with the LLM answer (Section 10.1)."""
+        if outcome.error is not None:
+            return Resolution(case.key, case.math_best, case.math_score, MANUAL_REVIEW, "error",
+                              str(outcome.error))
+        try:
+            answer = self.disambiguator.parse(outcome.response, case.candidates)
+        except ValueError as e:
+            return Resolution(case.key, case.math_best, case.math_score, MANUAL_REVIEW, "error", str(e))
+
+        author_id, confidence = answer["candidate_id"], answer["confidence"]
+        if author_id is None:
+            decision = UNREGISTERED
+        elif author_id == case.math_best:
+            # 수학 1위와 일치 → 신뢰도 상향
+            confidence = max(confidence, case.math_score)
+            decision = CONFIRMED if confidence >= self.threshold else MANUAL_REVIEW
+        else:
+            decision = MANUAL_REVIEW
+        return Resolution(case.key, author_id, confidence, decision, "llm", answer["evidence"])
+
+    def classify(self, cases):
+        """Author roles per paper; LLM only where the decision tree is unsure."""
+        cases = list(cases)
+        pending = [i for i, c in enumerate(cases) if c.math_confidence < self.threshold]
+        results = [RoleResult(c.key, c.math_authors, "math", None) for c in cases]
+        if self.packer is not None:
+            packed = [i for i in pending if not cases[i].ocr]
+            pending = [i for i in pending if cases[i].ocr]
+            answers = self.packer.classify([Paper(i, cases[i].pdf_text, cases[i].api_data)
+                                            for i in packed], self._dispatch)
+            for i in packed:
+                answer, case = answers[str(i)], cases[i]
+                results[i] = (RoleResult(case.key, case.math_authors, "error", answer)
+                              if isinstance(answer, str) else RoleResult(case.key, answer, "llm", None))
+        outcomes = self._dispatch([self.classifier.request(cases[i].pdf_text, cases[i].api_data,
+                                                            cases[i].ocr)
+                                   for i in pending], lambda k, r: self.classifier.parse(r))
+        for i, outcome in zip(pending, outcomes):
+            case = cases[i]
+            if outcome.error is not None:
+                results[i] = RoleResult(case.key, case.math_authors, "error", str(outcome.error))
+                continue
+            try:
+                authors = self.classifier.parse(outcome.response)["authors"]
+            except ValueError as e:
+                results[i] = RoleResult(case.key, case.math_authors, "error", str(e))
+            else:
+                results[i] = RoleResult(case.key, authors, "llm", None)
+        return results
@@ -0,0 +1,65 @@
+"""
+LLM 저자 역할 판별 (Section 8.3 LLMAuthorClassifier)
+- PDF 1페이지 텍스트 + KCI API 데이터 → 저자별 역할 JSON
+- request() 로 messages.create 인자를 만들어 두면 동기 호출 / 비동기 디스패처가 같은 요청을 사용
+"""
+from config import LLM_MODEL
+
+from .prompt_templates import (
+    OCR_CORRECTION_PROMPT, ROLE_CLASSIFICATION_PROMPT, complete_json, ocr_prompt, role_prompt,
+)
+
+ROLES = ("first_author", "corresponding", "co_first", "last_author", "co_author")
+
+
+def normalize_authors(authors):
+    """Validate an `authors` list in place; unknown roles become co_author."""
+    if not isinstance(authors, list) or not all(isinstance(a, dict) for a in authors):
+        raise ValueError("역할 판별 응답의 authors 형식이 잘못되었습니다")
+    for author in authors:
+        if author.get("role") not in ROLES:
+            author["role"] = "co_author"
+        author["confidence"] = float(author.get("confidence") or 0.0)
+    return authors
+
+
+class LLMAuthorClassifier:
+    """LLM-based author role classifier."""
+
+    def __init__(self, model=LLM_MODEL, client=None, max_tokens=2000):
+        self.model = model
+        self.max_tokens = max_tokens
+        self.system_prompt = ROLE_CLASSIFICATION_PROMPT
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from anthropic import Anthropic
+
+            self._client = Anthropic()
+        return self._client
+
+    def request(self, pdf_text, api_data=None, ocr=False):
+        """messages.create keyword arguments for one paper."""
+        if ocr:
+            system, user_prompt = OCR_CORRECTION_PROMPT, ocr_prompt(pdf_text)
+        else:
+            system, user_prompt = self.system_prompt, role_prompt(pdf_text, api_data)
+        return {
+            "model": self.model,
+            "system": system,
+            "messages": [{"role": "user", "content": user_prompt}],
+            "max_tokens": self.max_tokens,
+        }
+
+    def parse(self, response):
+        """`{"authors": [...]}` from a response; unknown roles become co_author."""
+        result = complete_json(response)
+        authors = result.get("authors", []) if isinstance(result, dict) else result
+        return {"authors": normalize_authors(authors)}
+
+    def classify_authors(self, pdf_text, api_data=None, ocr=False):
+        """Classify the authors of one paper with a synchronous API call."""
+        response = self.client.messages.create(**self.request(pdf_text, api_data, ocr))
+        return self.parse(response)
@@ -0,0 +1,59 @@
+"""
+LLM 동명이인 구분 (Section 8.3 LLMDisambiguator)
+- RIMS 후보 목록 + 새 논문 정보 → 후보 ID / 신뢰도 / 근거
+- request() 로 messages.create 인자를 만들어 두면 동기 호출 / 비동기 디스패처가 같은 요청을 사용
+"""
+from config import LLM_MODEL
+
+from .prompt_templates import DISAMBIGUATION_PROMPT, complete_json, disambiguation_prompt
+
+
+class LLMDisambiguator:
+    """LLM-based homonym disambiguator."""
+
+    def __init__(self, model=LLM_MODEL, client=None, max_tokens=1500):
+        self.model = model
+        self.max_tokens = max_tokens
+        self.system_prompt = DISAMBIGUATION_PROMPT
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from anthropic import Anthropic
+
+            self._client = Anthropic()
+        return self._client
+
+    def request(self, candidate_name, candidates, new_paper):
+        """messages.create keyword arguments for one homonym case."""
+        return {
+            "model": self.model,
+            "system": self.system_prompt,
+            "messages": [{"role": "user", "content": disambiguation_prompt(
+                candidate_name, candidates, new_paper)}],
+            "max_tokens": self.max_tokens,
+        }
+
+    def parse(self, response, candidates=None):
+        """`{"candidate_id", "confidence", "evidence"}` from a response.
+
+        An id that is not among `candidates` is treated as "none of them".
+        """
+        result = complete_json(response)
+        if not isinstance(result, dict):
+            raise ValueError("동명이인 응답이 JSON 객체가 아닙니다")
+        candidate_id = result.get("candidate_id")
+        if candidates is not None:
+            known = {str(c["id"]): c["id"] for c in candidates}
+            candidate_id = known.get(str(candidate_id))
+        return {
+            "candidate_id": candidate_id,
+            "confidence": float(result.get("confidence") or 0.0),
+            "evidence": result.get("evidence", ""),
+        }
+
+    def disambiguate(self, candidate_name, candidates, new_paper):
+        """Identify the new paper's author among `candidates` (synchronous call)."""
+        response = self.client.messages.create(**self.request(candidate_name, candidates, new_paper))
+        return self.parse(response, candidates)
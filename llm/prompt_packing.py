@@ -0,0 +1,170 @@
+"""
+역할 판별 묶음 요청 (Section 8.2 / 26)
+- 논문 여러 편의 1페이지 텍스트를 <논문 ID=..> 블록으로 구분해 요청 하나에 담음
+  (System Prompt 의 규칙은 요청당 한 번만 전송)
+- 입력 토큰 예산(estimate_tokens 기준)과 최대 논문 수 안에서 입력 순서대로 채움
+- 응답은 paper_id 를 키로 한 JSON 배열; 잘리거나(max_tokens) 빠진 논문은 나눠서 다시 요청
+"""
+import json
+from collections import namedtuple
+
+from config import LLM_PACK_INPUT_TOKENS, LLM_PACK_MAX_PAPERS, LLM_PACK_OUTPUT_TOKENS_PER_PAPER
+
+from .llm_classifier import LLMAuthorClassifier, normalize_authors
+from .prompt_templates import complete_json, estimate_tokens
+
+# paper_id: 프롬프트 안의 식별자 (문자열), api_data: KCI API 응답 (없으면 None)
+Paper = namedtuple("Paper", "paper_id pdf_text api_data")
+
+PACKED_ROLE_OUTPUT_FORMAT = """각 논문의 저자 역할을 다음 JSON 배열로 답하세요 (논문마다 한 항목, paper_id 는 위의 ID 그대로):
+[
+  {
+    "paper_id": "논문 ID",
+    "authors": [
+      {
+        "name_kr": "한글명",
+        "name_en": "영문명",
+        "role": "first_author | corresponding | co_first | last_author | co_author",
+        "rank": 순서번호,
+        "confidence": 0.0~1.0,
+        "evidence": "판별 근거 설명"
+      }
+    ]
+  }
+]"""
+
+
+def paper_block(paper):
+    """Delimited prompt block for one paper."""
+    api_data = paper.api_data
+    if api_data is not None and not isinstance(api_data, str):
+        api_data = json.dumps(api_data, ensure_ascii=False)
+    return f"""<논문 ID={paper.paper_id}>
+<PDF 텍스트>
+{paper.pdf_text}
+</PDF 텍스트>
+<KCI API 데이터>
+{api_data or "(없음)"}
+</KCI API 데이터>
+</논문>"""
+
+
+def packed_role_prompt(papers):
+    """User prompt for role classification of several papers at once."""
+    blocks = "\n\n".join(paper_block(p) for p in papers)
+    return f"""다음은 KCI 논문 {len(papers)}편의 PDF 1페이지에서 추출한 텍스트입니다:
+
+{blocks}
+
+{PACKED_ROLE_OUTPUT_FORMAT}"""
+
+
+def pack(papers, token_budget=LLM_PACK_INPUT_TOKENS, max_papers=LLM_PACK_MAX_PAPERS):
+    """Split `papers` into groups whose prompt fits `token_budget`, keeping input order.
+
+    A paper larger than the budget on its own forms a group of one.
+    """
+    overhead = estimate_tokens(packed_role_prompt([]))
+    groups, group, used = [], [], overhead
+    for paper in papers:
+        tokens = estimate_tokens(paper_block(paper)) + 1
+        if group and (used + tokens > token_budget or len(group) >= max_papers):
+            groups.append(group)
+            group, used = [], overhead
+        group.append(paper)
+        used += tokens
+    if group:
+        groups.append(group)
+    return groups
+
+
+class PackedRoleClassifier:
+    """Role classification with several papers per request.
+
+    `classify` dispatches packed requests, then re-packs whatever came back
+    missing: a response with nothing usable (e.g. cut off at max_tokens) is
+    split in half, a partial one has only its missing papers retried.  A
+    single paper that still fails is reported as an error.
+    """
+
+    def __init__(self, classifier=None, token_budget=LLM_PACK_INPUT_TOKENS,
+                 max_papers=LLM_PACK_MAX_PAPERS,
+                 output_tokens_per_paper=LLM_PACK_OUTPUT_TOKENS_PER_PAPER):
+        self.classifier = classifier or LLMAuthorClassifier()
+        self.token_budget = token_budget
+        self.max_papers = max_papers
+        self.output_tokens_per_paper = output_tokens_per_paper
+        self.stats = {"papers": 0, "requests": 0, "splits": 0, "retried": 0}
+
+    def request(self, papers):
+        """messages.create keyword arguments for one group of papers."""
+        return {
+            "model": self.classifier.model,
+            "system": self.classifier.system_prompt,
+            "messages": [{"role": "user", "content": packed_role_prompt(papers)}],
+            "max_tokens": max(self.classifier.max_tokens,
+                              self.output_tokens_per_paper * len(papers)),
+        }
+
+    def parse(self, response, paper_ids):
+        """``{paper_id: authors}`` for the papers answered completely in `response`.
+
+        Raises ValueError if the response holds no JSON array at all.
+        """
+        result = complete_json(response)
+        if isinstance(result, dict):
+            # 배열이 잘리면 parse_json 이 안쪽 객체 하나를 돌려주므로 단독 객체는 받지 않음
+            result = result.get("papers")
+        if not isinstance(result, list):
+            raise ValueError("묶음 응답이 JSON 배열이 아닙니다")
+        wanted = {str(p) for p in paper_ids}
+        answers = {}
+        for item in result:
+            if not isinstance(item, dict) or str(item.get("paper_id")) not in wanted:
+                continue
+            try:
+                answers[str(item["paper_id"])] = normalize_authors(item.get("authors", []))
+            except ValueError:
+                continue
+        return answers
+
+    def classify(self, papers, dispatch):
+        """``{paper_id: authors or error message (str)}`` for `papers`.
+
+        `dispatch(requests, validate)` maps a list of requests to `Outcome`s
+        in order (e.g. ``AsyncDispatcher().dispatch`` or ``BatchRunner().dispatch``).
+        """
+        papers = [p._replace(paper_id=str(p.paper_id)) for p in papers]
+        self.stats["papers"] += len(papers)
+        results = {}
+        groups = pack(papers, self.token_budget, self.max_papers)
+        while groups:
+            outcomes = dispatch([self.request(g) for g in groups],
+                                lambda k, r, groups=groups: self.parse(r, [p.paper_id for p in groups[k]]))
+            self.stats["requests"] += len(groups)
+            retry = []
+            for group, outcome in zip(groups, outcomes):
+                error = outcome.error
+                answers = {}
+                if error is None:
+                    try:
+                        answers = self.parse(outcome.response, [p.paper_id for p in group])
+                    except ValueError as e:
+                        error = e
+                results.update(answers)
+                missing = [p for p in group if p.paper_id not in answers]
+                if not missing:
+                    continue
+                if outcome.error is not None or len(group) == 1:
+                    # 전송 실패(디스패처가 이미 재시도) 또는 한 편짜리도 실패 → 오류로 보고
+                    for p in missing:
+                        results[p.paper_id] = str(error or "응답에 해당 논문이 없습니다")
+                elif len(missing) == len(group):
+                    half = len(group) // 2
+                    retry += [group[:half], group[half:]]
+                    self.stats["splits"] += 1
+                else:
+                    retry.append(missing)
+                    self.stats["retried"] += len(missing)
+            groups = retry
+        return results
@@ -0,0 +1,166 @@
+"""
+LLM 프롬프트 템플릿 (Section 8.2)
+- 영역 1 역할 판별 / 영역 2 동명이인 구분 / 영역 3 OCR 보정 System Prompt
+- User Prompt 조립, 응답 텍스트에서 JSON 추출, 입력 토큰 수 추정
+"""
+import json
+import re
+
+ROLE_CLASSIFICATION_PROMPT = """당신은 KCI 학술 논문의 저자 역할을 판별하는 전문가입니다.
+다음 규칙을 적용하여 각 저자의 역할을 판별하세요:
+- * 기호가 붙은 저자 → 교신저자 (corresponding author)
+- † 기호가 붙은 저자 → 공동제1저자 (equal contribution)
+- 저자 목록의 첫 번째 → 1저자 (first author)
+- 저자 목록의 마지막(3명 이상일 때) → 시니어/교신 후보
+- 하단 저자정보 블록에 "교신저자" 표기 → 교신저자 확정"""
+
+ROLE_OUTPUT_FORMAT = """각 저자에 대해 다음 JSON 형식으로 역할을 판별해주세요:
+{
+  "authors": [
+    {
+      "name_kr": "한글명",
+      "name_en": "영문명",
+      "role": "first_author | corresponding | co_first | last_author | co_author",
+      "rank": 순서번호,
+      "confidence": 0.0~1.0,
+      "evidence": "판별 근거 설명"
+    }
+  ]
+}"""
+
+DISAMBIGUATION_PROMPT = """당신은 학술 연구자의 동일성을 판별하는 전문가입니다.
+동명이인 구분 시 다음 신호를 종합적으로 고려하세요:
+1. 확정 식별자 (ORCID, 이메일) → 일치 시 동일인 확정
+2. 공저자 네트워크 → 같은 공저자와 함께 논문 = 동일인 가능성 높음
+3. 연구 주제 연속성 → 같은 분야 연구 = 동일인 가능성
+4. 소속 변경 타당성 → 시간순으로 자연스러운 경력 진행인지
+5. 메타데이터 → 기관명, 이니셜, 부가 식별자 등"""
+
+DISAMBIGUATION_OUTPUT_FORMAT = """다음 JSON 형식으로 답하세요 (해당 후보가 없으면 candidate_id 는 null):
+{"candidate_id": 후보 ID, "confidence": 0.0~1.0, "evidence": "판별 근거 설명"}"""
+
+OCR_CORRECTION_PROMPT = """다음은 OCR로 추출된 학술 논문 PDF의 저자 정보입니다.
+OCR 노이즈가 있을 수 있으니, 맥락을 고려하여 저자명과 역할을 판별하세요."""
+
+# 후보 정보 항목 (키, 표시명)
+CANDIDATE_FIELDS = (
+    ("affiliation", "소속"),
+    ("topics", "최근 논문 주제"),
+    ("coauthors", "공저자"),
+    ("active", "활동 기간"),
+)
+PAPER_FIELDS = (
+    ("title", "제목"),
+    ("affiliation", "소속"),
+    ("coauthors", "공저자"),
+    ("published", "발행"),
+)
+
+_JSON_START = re.compile(r"[\[{]")
+
+
+def _format_value(value):
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def _field_lines(record, fields):
+    return [f"- {label}: {_format_value(record[key])}"
+            for key, label in fields if record.get(key) not in (None, "", [], ())]
+
+
+def role_prompt(extracted_text, api_response=None):
+    """User prompt for role classification of one paper's first page."""
+    if api_response is not None and not isinstance(api_response, str):
+        api_response = json.dumps(api_response, ensure_ascii=False)
+    return f"""다음은 KCI 논문 PDF 1페이지에서 추출한 텍스트입니다:
+
+<PDF 텍스트>
+{extracted_text}
+</PDF 텍스트>
+
+<KCI API 데이터>
+{api_response or "(없음)"}
+</KCI API 데이터>
+
+{ROLE_OUTPUT_FORMAT}"""
+
+
+def disambiguation_prompt(candidate_name, candidates, new_paper):
+    """User prompt listing RIMS candidates (dicts with "id") and the new paper."""
+    blocks = []
+    for i, candidate in enumerate(candidates, 1):
+        lines = "\n".join(_field_lines(candidate, CANDIDATE_FIELDS))
+        blocks.append(f"<후보 {i}: ID={candidate['id']}>\n{lines}\n</후보>")
+    paper = "\n".join(_field_lines(new_paper, PAPER_FIELDS))
+    return f"""RIMS에서 "{candidate_name}"를 검색하여 다음 {len(candidates)}명의 후보를 발견했습니다:
+
+{chr(10).join(blocks)}
+
+새 논문 정보:
+{paper}
+
+이 논문의 "{candidate_name}"는 위 후보 중 누구인지 판별하세요.
+{DISAMBIGUATION_OUTPUT_FORMAT}"""
+
+
+def ocr_prompt(ocr_text):
+    return f"""OCR 추출 텍스트:
+"{ocr_text}"
+
+→ OCR 노이즈를 보정하고 저자 역할을 판별해주세요.
+{ROLE_OUTPUT_FORMAT}"""
+
+
+def message_text(message):
+    """Concatenated text blocks of a Messages API response (object or dict)."""
+    content = message["content"] if isinstance(message, dict) else message.content
+    parts = []
+    for block in content:
+        block_type = block["type"] if isinstance(block, dict) else block.type
+        if block_type == "text":
+            parts.append(block["text"] if isinstance(block, dict) else block.text)
+    return "".join(parts)
+
+
+def parse_json(text):
+    """First JSON object or array in `text` (code fences and prose are skipped).
+
+    Raises ValueError if there is none.
+    """
+    decoder = json.JSONDecoder()
+    for match in _JSON_START.finditer(text):
+        try:
+            return decoder.raw_decode(text, match.start())[0]
+        except ValueError:
+            continue
+    raise ValueError("응답에서 JSON 을 찾을 수 없습니다")
+
+
+def stop_reason(message):
+    """stop_reason of a Messages API response (object or dict)."""
+    return message.get("stop_reason") if isinstance(message, dict) else message.stop_reason
+
+
+def complete_json(message):
+    """JSON of a complete response; ValueError if cut off at max_tokens or without JSON."""
+    if stop_reason(message) == "max_tokens":
+        raise ValueError("응답이 max_tokens 에서 잘렸습니다")
+    return parse_json(message_text(message))
+
+
+def estimate_tokens(text):
+    """Rough token count: ~1 per Hangul syllable, ~1 per 4 other characters."""
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def request_tokens(request):
+    """Estimated input tokens of a messages.create request dict."""
+    text = request.get("system") or ""
+    for message in request.get("messages", ()):
+        content = message["content"]
+        text += content if isinstance(content, str) else "".join(
+            block.get("text", "") for block in content)
+    return estimate_tokens(text)
@@ -0,0 +1,139 @@
+"""
+LLM 응답 캐시 (SQLite)
+- 키: model + system + messages (+ max_tokens 등 생성 인자) 정규화 JSON 의 SHA-256
+- 프롬프트가 입력의 결정적 함수이므로 월간 재실행/임계값 튜닝 시 동일 요청은 API 호출 없이 응답
+- TTL 경과 항목은 조회 시 무효, 전체 크기가 상한을 넘으면 마지막 사용 시각이 오래된 순으로 삭제
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from config import LLM_CACHE_MAX_BYTES, LLM_CACHE_TTL_DAYS
+
+DEFAULT_CACHE_PATH = os.path.join(".llm_cache", "responses.sqlite")
+# 상한 초과 시 이 비율까지 줄여 삭제가 매 저장마다 일어나지 않게 함
+EVICT_TO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def request_key(request):
+    """Stable hash of a messages.create request."""
+    payload = json.dumps(request, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def response_dict(response):
+    """JSON-serializable form of a Messages API response (SDK object or dict)."""
+    if isinstance(response, dict):
+        return response
+    return response.model_dump(mode="json")
+
+
+class ResponseCache:
+    """Persistent request -> response cache with TTL and LRU size eviction.
+
+    `stats` counts hits, misses, expired entries, stores and evictions for
+    this instance.  ``ttl=None`` keeps entries forever.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=LLM_CACHE_TTL_DAYS * 86400,
+                 max_bytes=LLM_CACHE_MAX_BYTES, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self.size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "stores": 0, "evictions": 0}
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __contains__(self, request):
+        """Whether `request` has a live entry (counters and LRU order untouched)."""
+        row = self._db.execute("SELECT created FROM responses WHERE key = ?",
+                               (request_key(request),)).fetchone()
+        return row is not None and (self.ttl is None or self.clock() - row[0] <= self.ttl)
+
+    def get(self, request):
+        """Cached response dict for `request`, or None."""
+        key = request_key(request)
+        row = self._db.execute("SELECT response, size, created FROM responses WHERE key = ?",
+                               (key,)).fetchone()
+        now = self.clock()
+        if row is not None and self.ttl is not None and now - row[2] > self.ttl:
+            with self._db:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.size -= row[1]
+            self.stats["expired"] += 1
+            row = None
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        with self._db:
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self.stats["hits"] += 1
+        return json.loads(row[0])
+
+    def put(self, request, response):
+        """Store the response to `request`; evicts least recently used entries if over size."""
+        key = request_key(request)
+        data = json.dumps(response_dict(response), ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        now = self.clock()
+        with self._db:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                             (key, request.get("model"), data, size, now, now))
+        self.size += size - (old[0] if old else 0)
+        self.stats["stores"] += 1
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            self._evict(self.max_bytes * EVICT_TO)
+
+    def _evict(self, target):
+        freed, keys = 0, []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if self.size - freed <= target:
+                break
+            keys.append((key,))
+            freed += size
+        with self._db:
+            self._db.executemany("DELETE FROM responses WHERE key = ?", keys)
+        self.size -= freed
+        self.stats["evictions"] += len(keys)
+
+    def purge_expired(self):
+        """Delete every entry older than the TTL; returns the number removed."""
+        if self.ttl is None:
+            return 0
+        cutoff = self.clock() - self.ttl
+        with self._db:
+            removed = self._db.execute("DELETE FROM responses WHERE created < ?", (cutoff,)).rowcount
+        self.size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.stats["expired"] += removed
+        return removed
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
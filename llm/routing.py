@@ -0,0 +1,148 @@
+"""
+LLM 라우팅 정책 (Section 10.1 / 13)
+- 1차 수학 모델 결과(점수, 1·2위 차이, 신호 커버리지)와 응답 캐시 상태로 케이스별 경로 결정
+  math: 1차 판정 유지 / manual: LLM 없이 수동 검토 / llm: 2차 LLM 판별
+- 규칙(Rule)을 순서대로 평가해 처음 맞는 규칙을 적용, 규칙 목록을 바꿔 정책 교체
+- 실행마다 규칙별로 피한 LLM 호출 수(기준: Section 10.1 의 "자동 확정 외 전부 LLM")와
+  비용/지연 추정을 보고
+"""
+from collections import namedtuple
+
+import pandas as pd
+
+from config import (
+    AUTO_CONFIRM_SCORE, LLM_BATCH_PRICE_FACTOR, LLM_CONCURRENCY, LLM_INPUT_TOKENS_PER_MINUTE, LLM_LATENCY_SECONDS,
+    LLM_MIN_COVERAGE, LLM_MIN_MARGIN, LLM_OUTPUT_TOKENS, LLM_PRICE_PER_MTOK,
+    LLM_REQUESTS_PER_MINUTE, LLM_REVIEW_SCORE,
+)
+from identity.disambiguator import CONFIRMED, signal_matrix
+
+from .prompt_templates import request_tokens
+
+MATH, MANUAL, LLM = "math", "manual", "llm"
+
+# predicate(case, cached) -> bool, case: HomonymCase, cached: 응답 캐시에 요청이 있는지
+Rule = namedtuple("Rule", "name action predicate")
+Route = namedtuple("Route", "action rule cached")
+
+
+def signal_coverage(signals):
+    """Number of non-zero signals per row of a {signal: array} dict or (n, 4) array."""
+    return (signal_matrix(signals) > 0).sum(axis=1)
+
+
+def default_rules(review_score=LLM_REVIEW_SCORE, confirm_score=AUTO_CONFIRM_SCORE,
+                  min_margin=LLM_MIN_MARGIN, min_coverage=LLM_MIN_COVERAGE):
+    """Section 13 routing: only the 0.4~0.7 band with usable evidence goes to the LLM.
+
+    `math_margin` / `coverage` rules are skipped for cases that leave them None.
+    `cached` has the default's action: it only labels LLM-band cases answered
+    from the response cache, so the report can count the calls it saved.
+    """
+    return [
+        Rule("confirmed", MATH, lambda case, cached: case.math_decision == CONFIRMED),
+        # >= 0.7 인데 자동 확정되지 않음 → 1·2위 차이 부족, decide() 와 같이 수동 검토
+        Rule("above_band", MANUAL, lambda case, cached: case.math_score >= confirm_score),
+        # 판별 불가(0.0) → 캐시 여부와 관계없이 수동 검토
+        Rule("no_score", MANUAL, lambda case, cached: case.math_score <= 0),
+        # < 0.4 → RIMS 미등록 가능성, 1차 판정 유지
+        Rule("below_band", MATH, lambda case, cached: case.math_score < review_score),
+        # 1·2위 신호가 사실상 같음 → LLM 도 같은 근거만 봄, 중복 등록 의심으로 수동 검토
+        Rule("tie", MANUAL, lambda case, cached: case.math_margin is not None
+             and case.math_margin < min_margin),
+        # 최선 후보의 근거 신호가 부족 → 프롬프트에 줄 정보도 부족
+        Rule("low_coverage", MANUAL, lambda case, cached: case.coverage is not None
+             and case.coverage < min_coverage),
+        # 위 규칙을 모두 통과한 LLM 대상 중 캐시된 것 (경로는 기본과 같고 보고서 구분용 이름만 다름).
+        # 적격성 규칙보다 뒤에 두어 캐시 상태가 경로를 바꾸지 않게 함
+        Rule("cached", LLM, lambda case, cached: cached),
+    ]
+
+
+class RoutingPolicy:
+    """Ordered routing rules; cases no rule matches take `default` ("band" rule)."""
+
+    def __init__(self, rules=None, default=LLM):
+        self.rules = default_rules() if rules is None else list(rules)
+        self.default = default
+
+    def route(self, case, cached=False):
+        for rule in self.rules:
+            if rule.predicate(case, cached):
+                return Route(rule.action, rule.name, cached)
+        return Route(self.default, "band", cached)
+
+    def plan(self, cases, requests, cache=None):
+        """Route every case; `requests` are the LLM requests per case (None if never sent)."""
+        cases, requests = list(cases), list(requests)
+        routes = [self.route(case, cache is not None and request is not None and request in cache)
+                  for case, request in zip(cases, requests)]
+        return RoutingPlan(cases, requests, routes)
+
+
+class RoutingPlan:
+    """Routes of one run, with the avoided-call report and cost/latency estimate."""
+
+    def __init__(self, cases, requests, routes):
+        self.cases = cases
+        self.requests = requests
+        self.routes = routes
+
+    def indices(self, action):
+        return [i for i, route in enumerate(self.routes) if route.action == action]
+
+    def _tokens(self, i):
+        return request_tokens(self.requests[i]), LLM_OUTPUT_TOKENS
+
+    def _calls(self):
+        """Indices that will cost an API call (LLM route, not cached)."""
+        return [i for i, route in enumerate(self.routes) if route.action == LLM and not route.cached]
+
+    @staticmethod
+    def _cost(input_tokens, output_tokens, batch=False):
+        cost = (input_tokens * LLM_PRICE_PER_MTOK["input"]
+                + output_tokens * LLM_PRICE_PER_MTOK["output"]) / 1e6
+        return cost * LLM_BATCH_PRICE_FACTOR if batch else cost
+
+    def report(self, batch=False):
+        """Per-rule DataFrame: cases, LLM calls made, calls avoided and cost avoided (USD).
+
+        A call counts as avoided when Section 10.1 would have sent the case
+        (not auto-confirmed) but the rule kept it off the API.
+        """
+        rows = {}
+        for i, route in enumerate(self.routes):
+            row = rows.setdefault(route.rule, {"rule": route.rule, "action": route.action, "cases": 0,
+                                               "llm_calls": 0, "avoided_calls": 0,
+                                               "avoided_cost": 0.0})
+            row["cases"] += 1
+            called = route.action == LLM and not route.cached
+            row["llm_calls"] += called
+            if not called and self.cases[i].math_decision != CONFIRMED:
+                row["avoided_calls"] += 1
+                row["avoided_cost"] += self._cost(*self._tokens(i), batch=batch)
+        columns = ["rule", "action", "cases", "llm_calls", "avoided_calls", "avoided_cost"]
+        return pd.DataFrame(list(rows.values()), columns=columns)
+
+    def estimate(self, concurrency=LLM_CONCURRENCY, requests_per_minute=LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute=LLM_INPUT_TOKENS_PER_MINUTE, batch=False):
+        """Expected API calls, tokens, cost (USD) and wall-clock seconds for this run.
+
+        Latency is the slowest of concurrency, request-rate and token-rate
+        limits; None for batch mode (results arrive within 24 hours).
+        """
+        calls = self._calls()
+        input_tokens = sum(self._tokens(i)[0] for i in calls)
+        output_tokens = LLM_OUTPUT_TOKENS * len(calls)
+        latency = None
+        if not batch:
+            latency = max(len(calls) * LLM_LATENCY_SECONDS / concurrency,
+                          len(calls) / requests_per_minute * 60,
+                          input_tokens / tokens_per_minute * 60) if calls else 0.0
+        return {
+            "calls": len(calls),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost": self._cost(input_tokens, output_tokens, batch),
+            "latency": latency,
+        }
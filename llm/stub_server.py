@@ -0,0 +1,263 @@
+"""
+Messages API 스텁 서버 (로컬 검증용, API 키/비용 없음)
+- POST /v1/messages 에 Anthropic Messages API 형식으로 응답
+- 응답 지연, 429/529 실패 주입, 최대 동시 요청 수 기록
+- 응답 내용은 responder(요청 JSON) -> 텍스트 (기본: 프롬프트 종류별 고정 JSON)
+- Message Batches: POST /v1/messages/batches, GET .../{id}, GET .../{id}/results (JSONL)
+  batch_latency 초 뒤 ended, 실패 주입은 개별 결과의 errored 로 나타남
+
+    python -m llm.stub_server --port 8765 --fail-rate 0.1
+"""
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .prompt_templates import DISAMBIGUATION_PROMPT, estimate_tokens, request_tokens
+
+_CANDIDATE_ID = re.compile(r"<후보 \d+: ID=([^>]+)>")
+_PAPER_ID = re.compile(r"<논문 ID=([^>]+)>")
+_ERROR_TYPES = {429: "rate_limit_error", 500: "api_error", 529: "overloaded_error"}
+
+
+def default_responder(request):
+    """Disambiguation: pick the first candidate; role prompts: no authors (per paper if packed)."""
+    user = request["messages"][-1]["content"]
+    user = user if isinstance(user, str) else json.dumps(user, ensure_ascii=False)
+    if request.get("system") == DISAMBIGUATION_PROMPT:
+        ids = _CANDIDATE_ID.findall(user)
+        return json.dumps({"candidate_id": ids[0] if ids else None, "confidence": 0.8,
+                           "evidence": "stub"}, ensure_ascii=False)
+    papers = _PAPER_ID.findall(user)
+    if papers:
+        return json.dumps([{"paper_id": p, "authors": []} for p in papers], ensure_ascii=False)
+    return json.dumps({"authors": []})
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=()):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _not_found(self, path):
+        self._send_json(404, {"type": "error", "error": {"type": "not_found_error",
+                                                        "message": path}})
+
+    def do_GET(self):
+        stub = self.server.stub
+        path = self.path.split("?", 1)[0]
+        parts = path.rstrip("/").split("/")
+        if path.startswith("/v1/messages/batches/") and len(parts) in (5, 6):
+            batch_id = parts[4]
+            with stub._lock:
+                known = batch_id in stub.batches
+            if known and len(parts) == 5:
+                self._send_json(200, stub.batch_status(batch_id))
+                return
+            if known and parts[5] == "results" and stub.batch_status(batch_id)["results_url"]:
+                data = "".join(json.dumps(r, ensure_ascii=False) + "\n"
+                               for r in stub.batches[batch_id]["results"]).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/binary")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                return
+        self._not_found(path)
+
+    def do_POST(self):
+        stub = self.server.stub
+        path = self.path.split("?", 1)[0]
+        if path == "/v1/messages/batches":
+            self._send_json(200, stub.create_batch(self._read_json()["requests"]))
+            return
+        if path != "/v1/messages":
+            self._not_found(path)
+            return
+        request = self._read_json()
+        with stub.entered():
+            status = stub.injected_failure()
+            if status:
+                self._send_json(status, {"type": "error", "error": {
+                    "type": _ERROR_TYPES.get(status, "api_error"), "message": "stub failure"}},
+                    [("retry-after", str(stub.retry_after))])
+                return
+            try:
+                body = stub.message(request)
+            except Exception as e:
+                # responder 오류는 서버 오류로 응답 (클라이언트가 멈추지 않도록)
+                self._send_json(500, {"type": "error", "error": {"type": "api_error",
+                                                                "message": repr(e)}})
+                return
+            self._send_json(200, body)
+
+
+class StubServer:
+    """Threaded local server mimicking the Messages API.
+
+    Use as a context manager and point the client at `url`; `requests`,
+    `failures` and `max_in_flight` record what the server saw.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, fail_rate=0.0,
+                 fail_statuses=(429, 529), retry_after=0, responder=None, seed=0,
+                 batch_latency=0.0):
+        self.latency = latency
+        self.batch_latency = batch_latency
+        self.fail_rate = fail_rate
+        self.fail_statuses = fail_statuses
+        self.retry_after = retry_after
+        self.responder = responder or default_responder
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batches = {}
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @contextmanager
+    def entered(self):
+        """Count one request as in flight (after the configured latency)."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def injected_failure(self):
+        """HTTP status to fail the current request with, or None."""
+        with self._lock:
+            if self.fail_rate and self._random.random() < self.fail_rate:
+                self.failures += 1
+                return self._random.choice(self.fail_statuses)
+        return None
+
+    def message(self, request):
+        """A Messages API response body for `request`."""
+        text = self.responder(request)
+        return {
+            "id": f"msg_stub_{next(self._ids)}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get("model", "stub"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": request_tokens(request), "output_tokens": estimate_tokens(text)},
+        }
+
+    def create_batch(self, requests):
+        """Register a batch; every result is decided now and released after `batch_latency`."""
+        results = []
+        for item in requests:
+            with self._lock:
+                self.requests += 1
+            status = self.injected_failure()
+            if status:
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": _ERROR_TYPES.get(status, "api_error"), "message": "stub failure"}}}
+            else:
+                result = {"type": "succeeded", "message": self.message(item["params"])}
+            results.append({"custom_id": item["custom_id"], "result": result})
+        with self._lock:
+            batch_id = f"msgbatch_stub_{len(self.batches) + 1}"
+            self.batches[batch_id] = {"created": datetime.now(timezone.utc), "results": results}
+        return self.batch_status(batch_id)
+
+    def batch_status(self, batch_id):
+        """A MessageBatch body for `batch_id`."""
+        batch = self.batches[batch_id]
+        created = batch["created"]
+        ended = datetime.now(timezone.utc) >= created + timedelta(seconds=self.batch_latency)
+        counts = {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+        if ended:
+            for r in batch["results"]:
+                counts[r["result"]["type"]] += 1
+        else:
+            counts["processing"] = len(batch["results"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": counts,
+            "created_at": created.isoformat(),
+            "expires_at": (created + timedelta(days=1)).isoformat(),
+            "ended_at": (created + timedelta(seconds=self.batch_latency)).isoformat() if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Messages API 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 응답 지연 (초)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="429/529 실패 주입 비율")
+    args = parser.parse_args(argv)
+    stub = StubServer(args.host, args.port, args.latency, args.fail_rate)
+    print(f"stub Messages API: {stub.url}  (Ctrl+C 로 종료)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+author_classify 명령행 진입점
+- author-classify report: 전략보고서 생성 (DOCX / HTML / Markdown)
+- python-docx, pandas 등 무거운 모듈은 실제로 필요한 경로에서만 import
+  (Markdown 출력, --dry-run 은 python-docx 없이 실행)
+
+    python main.py report --sections III,VII --format md --out report.md
+"""
+import argparse
+import os
+import sys
+
+FORMATS = ("docx", "html", "md")
+# 손으로 관리하는 KCI_..._FINAL.md 를 덮어쓰지 않도록 별도 이름
+DEFAULT_REPORT = "KCI_저자식별_통합_전략보고서_generated"
+
+
+def _report_target(args, parser):
+    """Resolve (format, output path) from --format / --out."""
+    fmt = args.format
+    if args.out:
+        ext = os.path.splitext(args.out)[1].lower().lstrip(".")
+        if ext not in FORMATS:
+            parser.error(f"--out 확장자로 형식을 알 수 없습니다: {args.out} "
+                         f"(.{', .'.join(FORMATS)} 중 하나)")
+        if fmt is not None and fmt != ext:
+            parser.error(f"--format {fmt} 와 --out 확장자(.{ext})가 다릅니다")
+        fmt = ext
+    fmt = fmt or "docx"
+    return fmt, args.out or f"{DEFAULT_REPORT}.{fmt}"
+
+
+def cmd_report(args, parser):
+    from report import ReportContext, export_report, render_docx, select_parts
+
+    fmt, out = _report_target(args, parser)
+    if bool(args.article_csv) != bool(args.parti_csv):
+        parser.error("--article-csv 와 --parti-csv 는 함께 지정해야 합니다")
+    if fmt != "docx" and (args.workers != 1 or args.cache_dir):
+        parser.error("--workers / --cache-dir 는 DOCX 출력에서만 사용할 수 있습니다")
+    sections = args.sections.split(",") if args.sections else None
+    try:
+        parts = select_parts(sections)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    if args.article_csv:
+        ctx = ReportContext.from_rims(args.article_csv, args.parti_csv)
+    else:
+        ctx = ReportContext()
+
+    if args.dry_run:
+        from report.model import ReportModel
+
+        # Part 내용만 기록 (DOCX 렌더링/저장 없음)
+        for key, func in parts:
+            model = ReportModel()
+            func(model, ctx)
+            print(f"{key:<8} {len(model.calls):>4} blocks")
+        print(f"[dry-run] {len(parts)}개 Part → {out} ({fmt}), 저장하지 않음")
+        return 0
+
+    if fmt == "docx":
+        builder, stats = render_docx(ctx, sections=sections, workers=args.workers,
+                                     cache_dir=args.cache_dir)
+        if stats is not None:
+            print(f"재렌더링: {', '.join(stats['rendered']) or '없음'} / 캐시 사용: {len(stats['cached'])}개 Part")
+        builder.save(out)
+    else:
+        export_report([out], ctx, sections=sections, formats=[fmt])
+    print(f"생성 완료: {out} ({os.path.getsize(out):,} bytes)")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="author-classify", description="KCI 논문 저자 식별")
+    commands = parser.add_subparsers(dest="command", metavar="command", required=True)
+
+    report = commands.add_parser("report", help="저자식별 통합 전략보고서 생성",
+                                 description="저자식별 통합 전략보고서 생성")
+    report.add_argument("--sections", help="렌더링할 Part 목록 (예: III,VII,A). 생략 시 전체")
+    report.add_argument("--format", choices=FORMATS,
+                        help="출력 형식 (기본: --out 확장자, 없으면 docx)")
+    report.add_argument("--out", help=f"출력 경로 (기본: {DEFAULT_REPORT}.<format>)")
+    report.add_argument("--dry-run", action="store_true",
+                        help="Part별 내용 블록 수만 출력하고 파일은 쓰지 않음")
+    report.add_argument("--article-csv", help="rims_article_data.csv (parti-csv와 함께 지정 시 실데이터 집계)")
+    report.add_argument("--parti-csv", help="rims_article_parti_data.csv")
+    report.add_argument("--workers", type=int, default=1,
+                        help="Part 병렬 렌더링 프로세스 수 (DOCX 전용, 기본 1 = 직렬, 0 = CPU 수)")
+    report.add_argument("--cache-dir", help="Part 조각 캐시 디렉터리 (DOCX 전용)")
+    report.set_defaults(func=cmd_report, command_parser=report)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # 사용법 오류는 하위 명령 parser로 출력
+    return args.func(args, args.command_parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+저자명 매칭 / 역할 판별
+"""
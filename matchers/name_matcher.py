@@ -0,0 +1,235 @@
+"""
+5-Level 퍼지 저자명 매칭 (Section 15)
+- L1 완전 일치 / L2 성+이니셜 / L3 한글↔영문 / L4 소속·ORCID / L5 편집거리
+- 다중 키 블로킹 인덱스: 정규화 성 + 이니셜, 로마자 전체 표기, 이름 bigram
+- 같은 블록 안의 후보만 비교, L5는 블록 단위 rapidfuzz cdist 로 일괄 계산
+"""
+from collections import defaultdict, namedtuple
+
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
+
+from config import L5_MIN_SIMILARITY, NAME_MATCH_SCORES
+from utils.korean_utils import (
+    CANONICAL_SURNAMES, canonical_surname, given_name_variants, is_hangul,
+    romanize_syllable, split_korean_name, surname_romanizations,
+)
+from utils.text_normalizer import normalize_name, normalize_text
+
+# script: "ko" / "en", surname: 대표 로마자 성, given: 로마자 이름 (구분자 없음)
+# variants: L3 비교에 쓰는 이름 표기들 (한글 이름은 음절 표기 변형 조합)
+ParsedName = namedtuple("ParsedName", "script surname given initials abbreviated text variants")
+Match = namedtuple("Match", "index name level score")
+
+LEVEL_ORDER = ("L1", "L2", "L3", "L4", "L5")
+
+# cdist score_cutoff 경계값(예: 정확히 0.8)이 부동소수 오차로 빠지지 않도록
+_CUTOFF_EPS = 1e-6
+
+
+def parse_name(name):
+    """Parse a Hangul or Latin author name; None if nothing usable remains.
+
+    Latin names may be "Surname, Given", "Given Surname" or "Surname Given"
+    (the latter when the first token is a known Korean surname).
+    """
+    text = normalize_name(name)
+    if text is None:
+        return None
+    if is_hangul(text.replace(",", "")):
+        compact = text.replace(",", "").replace(" ", "")
+        surname, given = split_korean_name(compact)
+        variants = given_name_variants(given)
+        initials = "".join(romanize_syllable(ch)[:1] for ch in given)
+        return ParsedName("ko", canonical_surname(surname_romanizations(surname)[0]),
+                          variants[0], initials, False, compact, variants)
+
+    if "," in text:
+        surname, _, given = text.partition(",")
+        tokens = given.replace("-", " ").split()
+    else:
+        tokens = text.replace("-", " ").split()
+        if len(tokens) > 1 and tokens[0] in CANONICAL_SURNAMES and tokens[-1] not in CANONICAL_SURNAMES:
+            surname, tokens = tokens[0], tokens[1:]
+        else:
+            surname, tokens = tokens[-1], tokens[:-1]
+    surname = canonical_surname(surname.replace(" ", "").replace("-", ""))
+    given = "".join(tokens)
+    abbreviated = bool(tokens) and all(len(t) == 1 for t in tokens)
+    return ParsedName("en", surname, given, "".join(t[0] for t in tokens), abbreviated,
+                      f"{surname} {given}", (given,))
+
+
+def _initials_compatible(a, b):
+    return a.startswith(b) or b.startswith(a)
+
+
+def _bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)} or {text}
+
+
+class NameIndex:
+    """Blocking index over unique author names.
+
+    `names` are the candidate strings (e.g. the 312K unique PRTCPNT_NM
+    values); `affiliations` and `orcids`, when given, are parallel
+    sequences used by L4.  Candidates are only ever scored against queries
+    that share a block:
+
+    - exact: normalized text (L1) and (surname, romanized given) (L3); Hangul
+      names are indexed under every spelling from `given_name_variants`
+    - (surname, first initial): L2 and the L5 edit-distance pass
+    - (surname, given bigram): L5 fallback when the first initial differs
+    - ORCID, (affiliation, surname): L4
+    """
+
+    def __init__(self, names, affiliations=None, orcids=None):
+        self.names = list(names)
+        self.parsed = [parse_name(n) for n in self.names]
+        self._exact = defaultdict(list)
+        self._romanized = defaultdict(list)
+        self._initial_blocks = defaultdict(list)
+        self._bigram_blocks = defaultdict(list)
+        self._orcid = defaultdict(list)
+        self._affiliation = defaultdict(list)
+
+        for i, p in enumerate(self.parsed):
+            if p is None:
+                continue
+            self._exact[p.text].append(i)
+            if p.given and not p.abbreviated:
+                for variant in p.variants:
+                    self._romanized[(p.surname, variant)].append(i)
+                for gram in _bigrams(p.given):
+                    self._bigram_blocks[(p.surname, gram)].append(i)
+            self._initial_blocks[(p.surname, p.initials[:1])].append(i)
+        for i, orcid in enumerate(orcids or ()):
+            orcid = normalize_text(orcid)
+            if orcid:
+                self._orcid[orcid].append(i)
+        for i, agency in enumerate(affiliations or ()):
+            agency = normalize_text(agency)
+            p = self.parsed[i]
+            if agency and p is not None:
+                self._affiliation[(agency, p.surname)].append(i)
+
+        # L5 대상: (블록 종류, 키)별 (고유 이름 문자열, 해당 인덱스 목록)
+        self._l5_choices = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _l5_block(self, key, blocks):
+        cached = self._l5_choices.get((id(blocks), key))
+        if cached is None:
+            by_given = defaultdict(list)
+            for i in blocks.get(key, ()):
+                p = self.parsed[i]
+                if not p.abbreviated and p.given:
+                    by_given[p.given].append(i)
+            cached = (list(by_given), list(by_given.values()))
+            self._l5_choices[(id(blocks), key)] = cached
+        return cached
+
+    def match(self, name, affiliation=None, orcid=None, limit=5):
+        """Best candidates for one name, highest score first."""
+        return self.match_many([name], [affiliation], [orcid], limit=limit)[0]
+
+    def match_many(self, names, affiliations=None, orcids=None, limit=5):
+        """Match many names at once; returns one `Match` list per query.
+
+        Queries are grouped by block so each block's L5 pass is a single
+        `rapidfuzz.process.cdist` call over its distinct given names.
+        """
+        queries = [parse_name(n) for n in names]
+        affiliations = affiliations or [None] * len(queries)
+        orcids = orcids or [None] * len(queries)
+        best = [dict() for _ in queries]
+
+        def offer(qi, ci, level, score):
+            cur = best[qi].get(ci)
+            if cur is None or score > cur[1]:
+                best[qi][ci] = (level, score)
+
+        initial_groups = defaultdict(list)
+        for qi, q in enumerate(queries):
+            if q is None:
+                continue
+            for ci in self._exact.get(q.text, ()):
+                offer(qi, ci, "L1", NAME_MATCH_SCORES["L1"])
+            if q.given and not q.abbreviated:
+                # 같은 문자 체계끼리의 표기 변형 일치(정/중 → jung)는 L3 아님
+                for variant in q.variants:
+                    for ci in self._romanized.get((q.surname, variant), ()):
+                        if self.parsed[ci].script != q.script:
+                            offer(qi, ci, "L3", NAME_MATCH_SCORES["L3"])
+            key = (q.surname, q.initials[:1])
+            initial_groups[key].append(qi)
+            self._match_l4(qi, q, affiliations[qi], orcids[qi], offer)
+
+        for key, group in initial_groups.items():
+            self._match_l2(key, group, queries, offer)
+            self._match_l5(key, group, queries, self._initial_blocks, offer)
+
+        # 첫 이니셜이 다른 오타: 이름 bigram 블록에서 L5만 시도
+        fallback = defaultdict(list)
+        for qi, q in enumerate(queries):
+            if q is not None and not best[qi] and q.given and not q.abbreviated:
+                for gram in _bigrams(q.given):
+                    fallback[(q.surname, gram)].append(qi)
+        for key, group in fallback.items():
+            self._match_l5(key, group, queries, self._bigram_blocks, offer)
+
+        results = []
+        for found in best:
+            ranked = sorted(found.items(), key=lambda item: (-item[1][1], item[0]))[:limit]
+            results.append([Match(ci, self.names[ci], level, round(score, 4))
+                            for ci, (level, score) in ranked])
+        return results
+
+    def _match_l2(self, key, group, queries, offer):
+        block = self._initial_blocks.get(key, ())
+        if not block:
+            return
+        by_initials = defaultdict(lambda: ([], []))
+        for ci in block:
+            p = self.parsed[ci]
+            by_initials[p.initials][0 if p.abbreviated else 1].append(ci)
+        score = NAME_MATCH_SCORES["L2"]
+        for qi in group:
+            q = queries[qi]
+            for initials, (abbreviated, full) in by_initials.items():
+                if not _initials_compatible(q.initials, initials):
+                    continue
+                # 양쪽 모두 이름 전체가 있으면 이니셜 일치만으로는 L2 아님
+                for ci in abbreviated if not q.abbreviated else abbreviated + full:
+                    offer(qi, ci, "L2", score)
+
+    def _match_l4(self, qi, q, affiliation, orcid, offer):
+        score = NAME_MATCH_SCORES["L4"]
+        orcid = normalize_text(orcid)
+        if orcid:
+            for ci in self._orcid.get(orcid, ()):
+                offer(qi, ci, "L4", score)
+        agency = normalize_text(affiliation)
+        if agency:
+            for ci in self._affiliation.get((agency, q.surname), ()):
+                if _initials_compatible(q.initials, self.parsed[ci].initials):
+                    offer(qi, ci, "L4", score)
+
+    def _match_l5(self, key, group, queries, blocks, offer):
+        choices, owners = self._l5_block(key, blocks)
+        group = [qi for qi in group if queries[qi].given and not queries[qi].abbreviated]
+        if not choices or not group:
+            return
+        scores = process.cdist(
+            [queries[qi].given for qi in group], choices,
+            scorer=Levenshtein.normalized_similarity, dtype=np.float32,
+            score_cutoff=L5_MIN_SIMILARITY - _CUTOFF_EPS, workers=-1,
+        )
+        base = NAME_MATCH_SCORES["L5"]
+        for row, col in zip(*np.nonzero(scores)):
+            score = base + max(float(scores[row, col]) - L5_MIN_SIMILARITY, 0.0)
+            for ci in owners[col]:
+                offer(group[row], ci, "L5", score)
@@ -0,0 +1,27 @@
+"""
+KCI 저자 식별 전략보고서 생성 라이브러리
+- ReportBuilder: DOCX 헬퍼 (문서는 지연 생성)
+- PARTS / build_report: Part 단위 렌더링
+- export_report: 한 번 렌더링으로 DOCX / HTML / Markdown 출력
+- python-docx는 ReportBuilder를 처음 참조할 때 import (HTML/Markdown만 쓸 때는 불필요)
+"""
+from .context import ReportContext
+from .export import HtmlBuilder, MarkdownBuilder, export_report, render_docx
+from .sections import PARTS, build_report, select_parts
+
+# python-docx에 의존하는 이름은 지연 import
+_DOCX_NAMES = ("ReportBuilder", "set_cell_shading")
+
+__all__ = [
+    "ReportBuilder", "ReportContext", "PARTS",
+    "build_report", "select_parts", "set_cell_shading",
+    "HtmlBuilder", "MarkdownBuilder", "export_report", "render_docx",
+]
+
+
+def __getattr__(name):
+    if name in _DOCX_NAMES:
+        from . import builder
+
+        return getattr(builder, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,167 @@
+"""
+보고서 헬퍼 벤치마크
+- make_table / add_para / add_bullet / add_code_block / set_cell_shading 규모별 측정
+- 케이스마다 새 프로세스에서 실행: 실행 시간, 최대 RSS, 출력 크기
+- JSON 기준값과 비교해 임계값을 넘으면 실패 (종료 코드 1)
+
+    python -m report.benchmark --baseline bench_baseline.json --update
+    python -m report.benchmark --baseline bench_baseline.json
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# 28. 모듈 구조 코드 블록과 비슷한 길이의 한글 코드 블록
+CODE_BLOCK_TEXT = "\n".join(
+    f"│   ├── module_{i:02d}.py{' ' * 10}# 한글 주석: 저자 식별 모듈 {i}" for i in range(40)
+)
+
+TABLE_HEADERS = ["저자명", "PRTCPNT_ID", "소속기관", "논문 수"]
+
+# (helper, 규모)
+CASES = [
+    ("make_table", 10), ("make_table", 1_000), ("make_table", 100_000),
+    ("add_para", 1), ("add_para", 100), ("add_para", 10_000),
+    ("add_bullet", 1), ("add_bullet", 100), ("add_bullet", 10_000),
+    ("add_code_block", 1), ("add_code_block", 100), ("add_code_block", 10_000),
+    ("set_cell_shading", 10), ("set_cell_shading", 1_000), ("set_cell_shading", 100_000),
+]
+
+DEFAULT_THRESHOLD = 0.25
+# 작은 케이스의 측정 잡음은 무시
+MIN_SECONDS = 0.05
+MIN_RSS_MB = 5.0
+# ru_maxrss 단위: macOS 는 바이트, Linux 는 KiB
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _table_rows(n):
+    return [[f"김경수{i}", str(100000 + i), "성균관대학교 소프트웨어학과", str(i % 50)]
+            for i in range(n)]
+
+
+def _run_case(helper, size):
+    from docx.table import _Cell
+
+    from .builder import ReportBuilder, set_cell_shading
+    from .theme import TABLE_ZEBRA
+
+    b = ReportBuilder()
+    b.doc  # 문서 생성/스타일 설정은 측정에서 제외
+    if helper == "make_table":
+        rows = _table_rows(size)
+        start = time.perf_counter()
+        b.make_table(TABLE_HEADERS, rows, col_widths=[3, 3, 5, 2])
+    elif helper == "set_cell_shading":
+        cols = len(TABLE_HEADERS)
+        table = b.make_table(TABLE_HEADERS, _table_rows(-(-size // cols)))
+        cells = [_Cell(tc, table) for tc in table._tbl.iter_tcs()][:size]
+        start = time.perf_counter()
+        for cell in cells:
+            set_cell_shading(cell, TABLE_ZEBRA)
+    else:
+        method = getattr(b, helper)
+        text = CODE_BLOCK_TEXT if helper == "add_code_block" else "저자 역할 판별 결과 문단입니다. " * 4
+        start = time.perf_counter()
+        for i in range(size):
+            method(text)
+    elapsed = time.perf_counter() - start
+
+    buf = io.BytesIO()
+    b.doc.save(buf)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+    return {
+        "wall_s": round(elapsed, 4),
+        "peak_rss_mb": round(rss / 2 ** 20, 1),
+        "output_bytes": buf.tell(),
+    }
+
+
+def run_benchmarks(cases=CASES, repeat=3):
+    """Run every case `repeat` times, each in a fresh process.
+
+    Returns ``{case_id: metrics}`` keeping the best (lowest) time and RSS,
+    which is far less noisy than a single run.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for helper, size in cases:
+        runs = []
+        for _ in range(repeat):
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                runs.append(pool.submit(_run_case, helper, size).result())
+        results[f"{helper}:{size}"] = {
+            metric: min(run[metric] for run in runs) for metric in runs[0]
+        }
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return human-readable regressions of `results` against `baseline`."""
+    regressions = []
+    for case_id, cur in results.items():
+        base = baseline.get(case_id)
+        if base is None:
+            continue
+        for metric, floor in (("wall_s", MIN_SECONDS), ("peak_rss_mb", MIN_RSS_MB),
+                              ("output_bytes", 0)):
+            limit = base[metric] * (1 + threshold)
+            if cur[metric] > limit and cur[metric] - base[metric] > floor:
+                regressions.append(
+                    f"{case_id} {metric}: {cur[metric]} > {base[metric]} (+{threshold:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="보고서 헬퍼 벤치마크")
+    parser.add_argument("--baseline", default="bench_baseline.json", help="기준값 JSON 경로")
+    parser.add_argument("--update", action="store_true", help="측정 결과로 기준값 갱신")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"허용 증가율 (기본 {DEFAULT_THRESHOLD})")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--max-size", type=int, help="이 규모를 넘는 케이스 제외 (빠른 점검용)")
+    parser.add_argument("--only", help="측정할 helper 목록 (쉼표 구분)")
+    args = parser.parse_args(argv)
+
+    cases = CASES
+    if args.max_size:
+        cases = [c for c in cases if c[1] <= args.max_size]
+    if args.only:
+        wanted = set(args.only.split(","))
+        cases = [c for c in cases if c[0] in wanted]
+
+    results = run_benchmarks(cases, args.repeat)
+    for case_id, m in results.items():
+        print(f"{case_id:<24} {m['wall_s']:>9.3f}s {m['peak_rss_mb']:>8.1f}MB {m['output_bytes']:>12,}B")
+
+    if args.update:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            baseline = {}
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"기준값 없음: {args.baseline} (--update 로 생성)")
+        return 1
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+"""
+보고서 DOCX 빌더
+- 문서 생성(페이지/스타일 설정)은 처음 사용할 때까지 지연
+- 제목/본문/글머리표/표/코드 블록 헬퍼
+"""
+import io
+import zipfile
+from copy import deepcopy
+from functools import lru_cache
+
+from docx import Document
+from docx.shared import Pt, Cm, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import parse_xml
+from lxml import etree
+
+from .theme import FONT_KR, FONT_CODE, TABLE_HEADER, TABLE_ZEBRA, C_NAVY, C_WHITE
+
+_FONT_LABELS = {FONT_KR: "Text", FONT_CODE: "Code"}
+
+_ALIGNMENTS = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
+}
+
+# make_table()은 이 행 수 이상이면 bulk 모드로 전환
+BULK_TABLE_MIN_ROWS = 200
+
+# 저장 시 zip 항목 시각 고정 (같은 내용 → 같은 바이트)
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def stable_zipinfo(name, external_attr=0):
+    info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = external_attr
+    return info
+
+
+@lru_cache(maxsize=None)
+def _shading_template(color_hex):
+    return parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>')
+
+
+def set_cell_shading(cell, color_hex):
+    cell._tc.get_or_add_tcPr().append(deepcopy(_shading_template(color_hex)))
+
+
+def _set_font(font, name):
+    """Set ascii/hAnsi (and eastAsia for the Korean font) on a style font."""
+    font.name = name
+    rFonts = font.element.rPr.rFonts
+    for attr in ('w:asciiTheme', 'w:hAnsiTheme', 'w:eastAsiaTheme', 'w:cstheme'):
+        rFonts.attrib.pop(qn(attr), None)
+    if name == FONT_KR:
+        rFonts.set(qn('w:eastAsia'), FONT_KR)
+
+
+def _add_run(p, text, style):
+    # run.style = ... 는 매 호출마다 기본 스타일을 조회하므로 styleId를 직접 지정
+    run = p.add_run(text)
+    run._r.style = style.style_id
+    return run
+
+
+class _TableTemplate:
+    """Pre-rendered header / zebra row prototypes for bulk table building.
+
+    The prototype rows are produced by the regular python-docx path, so every
+    row cloned from them carries exactly the run properties, shading and cell
+    widths that the per-cell path would have written.
+    """
+
+    def __init__(self, builder, table, headers, col_widths=None, header_color=TABLE_HEADER):
+        builder._fill_header(table.rows[0].cells, headers, header_color)
+        for r in (0, 1):
+            builder._fill_row(table.rows[r + 1].cells, [""] * len(headers), r)
+        if col_widths:
+            for i, w in enumerate(col_widths):
+                for row in table.rows:
+                    row.cells[i].width = Cm(w)
+
+        tbl = table._tbl
+        header_tr, even_tr, odd_tr, blank_tr = tbl.tr_lst
+        self._body = (even_tr, odd_tr)
+        self._blank_tcs = blank_tr.tc_lst
+        for tr in (even_tr, odd_tr, blank_tr):
+            tbl.remove(tr)
+
+    def row(self, r, values):
+        """Return a new `w:tr` for body row index `r` filled with `values`."""
+        tr = deepcopy(self._body[r % 2])
+        tcs = tr.tc_lst
+        if len(values) > len(tcs):
+            raise IndexError("row has more values than table columns")
+        for tc, val in zip(tcs, values):
+            tc.p_lst[0].r_lst[-1].text = str(val)
+        # 짧은 행: 값이 없는 셀은 기본(빈) 셀로 유지
+        for c in range(len(values), len(tcs)):
+            tr.replace(tcs[c], deepcopy(self._blank_tcs[c]))
+        return tr
+
+
+class ReportBuilder:
+    """Thin python-docx wrapper holding one report document.
+
+    The underlying `Document` is created (with page and style setup) the
+    first time it is needed, so constructing a builder is free.
+    """
+
+    def __init__(self, template=None):
+        self._template = template
+        self._doc = None
+        # 문자 스타일 캐시: (font, size, bold, color) -> style
+        self._char_styles = {}
+
+    @property
+    def doc(self):
+        if self._doc is None:
+            self._doc = Document(self._template)
+            self._setup_page()
+            self.setup_styles()
+        return self._doc
+
+    def _setup_page(self):
+        section = self._doc.sections[0]
+        section.page_width = Cm(21)
+        section.page_height = Cm(29.7)
+        section.top_margin = Cm(2.5)
+        section.bottom_margin = Cm(2.5)
+        section.left_margin = Cm(2.5)
+        section.right_margin = Cm(2.5)
+
+    def setup_styles(self):
+        """Register the document-wide font setup once.
+
+        Normal and the heading paragraph styles carry the Korean font, so runs
+        only reference a named character style (see `char_style`) instead of
+        repeating `rFonts` in every run.
+        """
+        styles = self.doc.styles
+        style = styles['Normal']
+        _set_font(style.font, FONT_KR)
+        style.font.size = Pt(10)
+        style.paragraph_format.space_after = Pt(6)
+        style.paragraph_format.line_spacing = 1.15
+        for level in (1, 2, 3):
+            _set_font(styles[f'Heading {level}'].font, FONT_KR)
+
+        # 표 헤더/본문과 글머리표는 모든 보고서에서 쓰이므로 미리 등록
+        self.char_style(size=9, bold=True, color=C_WHITE)
+        self.char_style(size=9)
+        self.char_style(size=10, bold=True)
+        self.char_style(size=10)
+
+    def char_style(self, size=None, bold=None, color=None, font=FONT_KR):
+        """Return the named character style for this run formatting.
+
+        Styles are created on first use and reused afterwards, e.g.
+        ``KCI Text 10pt Bold 0F4C81``.  `color` is a hex string (see
+        `report.theme`) or an `RGBColor`.
+        """
+        styles = self.doc.styles  # 문서(기본 스타일 포함) 생성이 먼저
+        key = (font, size, bold, str(color) if color else None)
+        style = self._char_styles.get(key)
+        if style is not None:
+            return style
+
+        parts = ["KCI", _FONT_LABELS.get(font, font)]
+        if size:
+            parts.append(f"{size}pt")
+        if bold is not None:
+            parts.append("Bold" if bold else "Regular")
+        if color:
+            parts.append(str(color))
+        style = styles.add_style(" ".join(parts), WD_STYLE_TYPE.CHARACTER)
+        style.base_style = styles['Default Paragraph Font']
+        _set_font(style.font, font)
+        if size:
+            style.font.size = Pt(size)
+        if bold is not None:
+            style.font.bold = bold
+        if color:
+            style.font.color.rgb = RGBColor.from_string(str(color))
+        self._char_styles[key] = style
+        return style
+
+    # ── Content helpers ──
+
+    def add_heading(self, text, level=1, color=C_NAVY):
+        h = self.doc.add_heading(level=level)
+        _add_run(h, text, self.char_style(color=color))
+        return h
+
+    def add_para(self, text, bold=False, color=None, size=10, align=None, space_after=6):
+        p = self.doc.add_paragraph()
+        if align:
+            p.alignment = _ALIGNMENTS.get(align, align)
+        p.paragraph_format.space_after = Pt(space_after)
+        _add_run(p, text, self.char_style(size=size, bold=bold, color=color))
+        return p
+
+    def add_bullet(self, text, level=0, bold_prefix="", color=None):
+        p = self.doc.add_paragraph(style='List Bullet')
+        p.paragraph_format.left_indent = Pt(18 + level * 18)
+        if bold_prefix:
+            _add_run(p, bold_prefix, self.char_style(size=10, bold=True, color=color))
+        _add_run(p, text, self.char_style(size=10))
+        return p
+
+    def _fill_header(self, cells, headers, header_color):
+        for cell, h in zip(cells, headers):
+            cell.text = ""
+            p = cell.paragraphs[0]
+            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            _add_run(p, h, self.char_style(size=9, bold=True, color=C_WHITE))
+            set_cell_shading(cell, header_color)
+
+    def _fill_row(self, cells, row_data, r):
+        for c, val in enumerate(row_data):
+            cell = cells[c]
+            cell.text = ""
+            p = cell.paragraphs[0]
+            p.alignment = WD_ALIGN_PARAGRAPH.CENTER if c > 0 else WD_ALIGN_PARAGRAPH.LEFT
+            _add_run(p, str(val), self.char_style(size=9))
+            if r % 2 == 1:
+                set_cell_shading(cell, TABLE_ZEBRA)
+
+    def _add_table(self, n_rows, n_cols):
+        table = self.doc.add_table(rows=n_rows, cols=n_cols)
+        table.style = 'Table Grid'
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        return table
+
+    def table_template(self, headers, col_widths=None, header_color=TABLE_HEADER):
+        """Add a header-only table; return it with its body-row template."""
+        table = self._add_table(4, len(headers))
+        return table, _TableTemplate(self, table, headers, col_widths, header_color)
+
+    def make_table(self, headers, rows, col_widths=None, header_color=TABLE_HEADER, bulk=None):
+        """Add a zebra-striped table with a shaded header row.
+
+        `bulk` builds the `w:tbl` body from cloned prototype rows instead of
+        walking `table.rows[r].cells[c]`; the XML is identical either way.  It
+        defaults to on for tables of `BULK_TABLE_MIN_ROWS` rows or more.
+        """
+        if bulk is None:
+            bulk = len(rows) >= BULK_TABLE_MIN_ROWS
+        if bulk:
+            table, template = self.table_template(headers, col_widths, header_color)
+            tbl = table._tbl
+            for r, row_data in enumerate(rows):
+                tbl.append(template.row(r, row_data))
+        else:
+            table = self._add_table(1 + len(rows), len(headers))
+            self._fill_header(table.rows[0].cells, headers, header_color)
+            for r, row_data in enumerate(rows):
+                self._fill_row(table.rows[r + 1].cells, row_data, r)
+
+            if col_widths:
+                for i, w in enumerate(col_widths):
+                    for row in table.rows:
+                        row.cells[i].width = Cm(w)
+
+        self.doc.add_paragraph()  # spacing
+        return table
+
+    def add_code_block(self, text, font_size=9, bold=None, color=None):
+        """Add a monospaced code block."""
+        p = self.doc.add_paragraph()
+        _add_run(p, text, self.char_style(size=font_size, bold=bold, color=color, font=FONT_CODE))
+        return p
+
+    def add_blank(self):
+        return self.doc.add_paragraph()
+
+    def add_page_break(self):
+        return self.doc.add_page_break()
+
+    # ── Fragments ──
+
+    def style_keys(self):
+        """Character style keys in registration order (see `add_fragment`)."""
+        return list(self._char_styles)
+
+    def fragment(self):
+        """Serialize the body content (without `w:sectPr`) for `add_fragment`."""
+        body = deepcopy(self.doc.element.body)
+        for sectPr in body.findall(qn('w:sectPr')):
+            body.remove(sectPr)
+        return etree.tostring(body)
+
+    def add_fragment(self, xml, style_keys=()):
+        """Append a body fragment rendered by another builder.
+
+        The character styles the fragment references are registered here in
+        the order given, so splicing fragments in report order yields the
+        same styles.xml as rendering serially.  List numbering needs no
+        fix-up: every builder starts from the same template, so the
+        'List Bullet' numbering ids already agree.
+        """
+        for font, size, bold, color in style_keys:
+            self.char_style(size=size, bold=bold, color=color, font=font)
+        body = self.doc.element.body
+        sectPr = body.sectPr
+        for el in list(parse_xml(xml)):
+            if sectPr is not None:
+                sectPr.addprevious(el)
+            else:
+                body.append(el)
+
+    def save(self, path):
+        """Save with fixed zip timestamps so identical content is byte-identical."""
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+            self.copy_package(dst)
+        return path
+
+    def copy_package(self, dst, skip=()):
+        """Write every package part except `skip` into the open zip `dst`."""
+        buf = io.BytesIO()
+        self.doc.save(buf)
+        buf.seek(0)
+        with zipfile.ZipFile(buf) as src:
+            for info in src.infolist():
+                if info.filename not in skip:
+                    dst.writestr(stable_zipinfo(info.filename, info.external_attr),
+                                 src.read(info))
@@ -0,0 +1,121 @@
+"""
+섹션 단위 증분 렌더링
+- Part마다 내용 해시 계산 (기록된 헬퍼 호출 + 렌더러 버전)
+- 렌더링된 XML 조각을 디스크에 캐시, 해시가 바뀐 Part만 다시 렌더링
+"""
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import docx
+
+from . import builder as builder_module, theme as theme_module
+from .builder import ReportBuilder
+from .context import ReportContext
+from .model import ReportModel
+from .parallel import render_part
+from .sections import select_parts
+
+DEFAULT_CACHE_DIR = ".report_cache"
+
+
+@lru_cache(maxsize=None)
+def renderer_version():
+    """Hash of the DOCX rendering code; a change invalidates every fragment."""
+    source = "".join(inspect.getsource(m) for m in (builder_module, theme_module))
+    version = getattr(docx, "__version__", "")
+    return hashlib.sha256(f"{version}\n{source}".encode("utf-8")).hexdigest()
+
+
+def section_digest(func, ctx, template=None):
+    """Content hash of one part: everything it would render, plus the renderer."""
+    model = ReportModel()
+    func(model, ctx)
+    payload = f"{renderer_version()}\n{template or ''}\n{model.digest()}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SectionCache:
+    """On-disk store of rendered part fragments keyed by part and digest."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, f"part_{key}")
+        return base + ".json", base + ".xml"
+
+    def get(self, key, digest):
+        """Return ``(xml, style_keys)`` if the cached fragment matches `digest`."""
+        meta_path, xml_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("digest") != digest:
+                return None
+            with open(xml_path, "rb") as f:
+                xml = f.read()
+        except (OSError, ValueError):
+            return None
+        return xml, [tuple(k) for k in meta["style_keys"]]
+
+    def put(self, key, digest, xml, style_keys):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta_path, xml_path = self._paths(key)
+        # 조각을 먼저 쓰고 메타데이터를 마지막에 교체 (중단 시 불일치 방지)
+        _atomic_write(xml_path, xml)
+        meta = {"digest": digest, "style_keys": style_keys}
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+
+def _atomic_write(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def render_incremental(ctx=None, sections=None, cache_dir=DEFAULT_CACHE_DIR,
+                       workers=1, template=None):
+    """Render the report, re-rendering only parts whose digest changed.
+
+    Returns ``(builder, stats)`` where `stats` lists the ``rendered`` and
+    ``cached`` part keys.  The spliced result is identical to `build_report`.
+    """
+    if ctx is None:
+        ctx = ReportContext()
+    cache = SectionCache(cache_dir)
+    parts = select_parts(sections)
+
+    fragments = {}
+    stale = []
+    for key, func in parts:
+        digest = section_digest(func, ctx, template)
+        hit = cache.get(key, digest)
+        if hit is None:
+            stale.append((key, digest))
+        else:
+            fragments[key] = hit
+
+    stale_keys = [key for key, _ in stale]
+    if workers > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as pool:
+            results = list(pool.map(render_part, stale_keys, [ctx] * len(stale),
+                                    [template] * len(stale)))
+    else:
+        results = [render_part(key, ctx, template) for key in stale_keys]
+    for (key, digest), (_, xml, style_keys) in zip(stale, results):
+        cache.put(key, digest, xml, style_keys)
+        fragments[key] = (xml, style_keys)
+
+    builder = ReportBuilder(template)
+    for key, _ in parts:
+        builder.add_fragment(*fragments[key])
+    stats = {
+        "rendered": stale_keys,
+        "cached": [key for key, _ in parts if key not in stale_keys],
+    }
+    return builder, stats
@@ -0,0 +1,53 @@
+"""
+보고서 데이터 컨텍스트
+- 각 Part 함수에 builder와 함께 전달되는 데이터
+- 기본값은 2026.02 RIMS 덤프 기준 수치, from_rims()로 실데이터 집계
+"""
+
+# 2026.02 RIMS 덤프 기준 (보고서 초판 수치)
+BASELINE_STATS = {
+    "papers_total": 136952,
+    "kci_papers": 24532,
+    "kci_with_doi": 15872,
+    "kci_only": 8660,
+    "participant_records": 5134679,
+    "unique_names": 312456,
+    "unique_prtcpnt_ids": 19666,
+    "records_without_id": 4760125,
+    "tpi_counts": {"2": 9851, "3": 3797, "4": 486351},
+    "homonym_people": 13577,
+    "top_homonyms": [("Kim, J.", 214), ("Lee, J.", 210)],
+    "multi_affiliation_ids": 6167,
+    "abstract_rate": 0.870,
+    "kci_abstract_rate": 0.974,
+    "orcid_ids": 69,
+    "scopus_ids": 1240,
+    "email_ids": 10437,
+    "coauthored_papers": 78509,
+    "monthly_papers": 2000,
+    "monthly_author_records": 7400,
+    # 1차 수학 알고리즘 자동 확정 비율 (Section 10.1)
+    "auto_rate": 0.70,
+}
+
+
+class ReportContext:
+    """Data shared by the report parts.
+
+    `stats` overrides the `BASELINE_STATS` figures; parts read them with
+    ``ctx["kci_papers"]`` and must treat the context as read-only.
+    """
+
+    def __init__(self, stats=None):
+        self.stats = dict(BASELINE_STATS)
+        self.stats.update(stats or {})
+
+    def __getitem__(self, key):
+        return self.stats[key]
+
+    @classmethod
+    def from_rims(cls, article_csv, parti_csv, **kwargs):
+        """Build a context from the RIMS dump CSVs (see `data.rims_stats`)."""
+        from data.rims_stats import collect_stats
+
+        return cls(collect_stats(article_csv, parti_csv, **kwargs))
@@ -0,0 +1,261 @@
+"""
+다중 형식 출력 (DOCX / HTML / Markdown)
+- Part를 ReportModel에 한 번만 렌더링하고 형식별 builder에 재생
+- Markdown / HTML builder는 python-docx 없이 문자열만 생성
+"""
+import html
+import os
+import re
+
+from .context import ReportContext
+from .model import ReportModel
+from .sections import build_report
+from .theme import FONT_KR, FONT_CODE, TABLE_HEADER, TABLE_ZEBRA, C_NAVY, C_WHITE
+
+# 줄 안 어디서나 강조/코드/링크/HTML/취소선으로 읽힐 문자
+_MD_INLINE = re.compile(r"([\\`*_\[\]<>~])")
+# 문단 첫머리에서 목록/제목 표시로 읽힐 문자
+_MD_MARKER = re.compile(r"^(\s*)([-+*#>])(?=\s)", re.MULTILINE)
+_MD_ORDERED = re.compile(r"^(\s*)(\d+)\.(?=\s)", re.MULTILINE)
+
+# 이 크기 이상의 본문 문단은 문서 제목으로 취급 (표지 제목 22pt)
+TITLE_MIN_SIZE = 18
+
+
+class _TextBuilder:
+    """Common base for the text backends: collects blocks, saves as UTF-8."""
+
+    def __init__(self):
+        self.blocks = []
+
+    def add_blank(self):
+        pass
+
+    def text(self):
+        raise NotImplementedError
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(self.text())
+        return path
+
+
+class MarkdownBuilder(_TextBuilder):
+    """Render the builder helpers as GitHub-flavoured Markdown.
+
+    Heading levels are shifted by one so the cover title is the only ``#``
+    heading, matching the hand-written FINAL.md.  Colours, font sizes and
+    alignment have no Markdown equivalent and are dropped.
+    """
+
+    def _block(self, text, kind="block"):
+        self.blocks.append((kind, text))
+
+    def add_heading(self, text, level=1, color=C_NAVY):
+        self._block(f"{'#' * (level + 1)} {_md_heading(text)}")
+
+    def add_para(self, text, bold=False, color=None, size=10, align=None, space_after=6):
+        if size >= TITLE_MIN_SIZE:
+            self._block(f"# {_md_heading(text)}")
+        else:
+            text = _md_escape(text)
+            self._block(f"**{text}**" if bold else text)
+
+    def add_bullet(self, text, level=0, bold_prefix="", color=None):
+        # 닫는 ** 앞에 공백이 오면 강조로 읽히지 않으므로 뒤 공백은 밖으로
+        stripped = bold_prefix.rstrip()
+        prefix = f"**{_md_escape(stripped)}**{bold_prefix[len(stripped):]}" if stripped else ""
+        self._block(f"{'  ' * level}- {prefix}{_md_escape(text)}", kind="bullet")
+
+    def make_table(self, headers, rows, col_widths=None, header_color=TABLE_HEADER, bulk=None):
+        lines = [_md_row(headers), "|" + "|".join("------" for _ in headers) + "|"]
+        lines.extend(_md_row(row) for row in rows)
+        self._block("\n".join(lines))
+
+    def add_code_block(self, text, font_size=9, bold=None, color=None):
+        # 본문의 가장 긴 백틱 연속보다 긴 울타리 (``` 줄이 블록을 닫지 않게)
+        fence = "`" * max(3, max((len(run) for run in re.findall("`+", text)), default=0) + 1)
+        self._block(f"{fence}\n{text}\n{fence}")
+
+    def add_page_break(self):
+        self._block("---")
+
+    def text(self):
+        out = []
+        prev = None
+        for kind, text in self.blocks:
+            if out:
+                # 연속된 글머리표는 한 목록으로
+                out.append("\n" if kind == prev == "bullet" else "\n\n")
+            out.append(text)
+            prev = kind
+        return "".join(out) + "\n"
+
+
+def _md_escape(text):
+    """Escape Markdown control characters so `text` renders literally."""
+    text = _MD_INLINE.sub(r"\\\1", str(text))
+    text = _MD_MARKER.sub(r"\1\\\2", text)
+    return _MD_ORDERED.sub(r"\1\2\\.", text)
+
+
+def _md_heading(text):
+    # 제목 끝의 '#' 은 닫는 표시로 읽히므로 이스케이프
+    return re.sub(r"(#+)\s*$", r"\\\1", _md_escape(text))
+
+
+def _md_row(values):
+    cells = (_md_escape(v).replace("|", "\\|").replace("\n", "<br>") for v in values)
+    return "| " + " | ".join(cells) + " |"
+
+
+def _css(color=None, size=None, bold=False, align=None):
+    rules = []
+    if color:
+        rules.append(f"color:#{color}")
+    if size:
+        rules.append(f"font-size:{size}pt")
+    if bold:
+        rules.append("font-weight:bold")
+    if align:
+        rules.append(f"text-align:{align}")
+    return f' style="{";".join(rules)}"' if rules else ""
+
+
+class HtmlBuilder(_TextBuilder):
+    """Render the builder helpers as a standalone HTML page.
+
+    Keeps the DOCX look where HTML can express it: heading and run colours,
+    font sizes, centred paragraphs, shaded table headers and zebra rows.
+    """
+
+    def __init__(self, title="KCI 저자 식별 알고리즘 통합 전략 보고서"):
+        super().__init__()
+        self.title = title
+        self._in_list = False
+
+    def _block(self, text):
+        if self._in_list:
+            self.blocks.append("</ul>")
+            self._in_list = False
+        self.blocks.append(text)
+
+    def add_heading(self, text, level=1, color=C_NAVY):
+        tag = f"h{min(level + 1, 6)}"
+        self._block(f"<{tag}{_css(color)}>{html.escape(text)}</{tag}>")
+
+    def add_para(self, text, bold=False, color=None, size=10, align=None, space_after=6):
+        tag = "h1" if size >= TITLE_MIN_SIZE else "p"
+        style = _css(color, size, bold, align)
+        self._block(f"<{tag}{style}>{html.escape(text)}</{tag}>")
+
+    def add_bullet(self, text, level=0, bold_prefix="", color=None):
+        if not self._in_list:
+            self.blocks.append("<ul>")
+            self._in_list = True
+        prefix = f"<b{_css(color)}>{html.escape(bold_prefix)}</b>" if bold_prefix else ""
+        indent = f' style="margin-left:{level * 18}pt"' if level else ""
+        self.blocks.append(f"<li{indent}>{prefix}{html.escape(text)}</li>")
+
+    def make_table(self, headers, rows, col_widths=None, header_color=TABLE_HEADER, bulk=None):
+        lines = ["<table>"]
+        if col_widths:
+            lines.append("<colgroup>" + "".join(f'<col style="width:{w}cm">' for w in col_widths)
+                         + "</colgroup>")
+        head = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+        lines.append(f'<thead><tr style="background:#{header_color};color:#{C_WHITE}">{head}</tr></thead>')
+        lines.append("<tbody>")
+        for r, row in enumerate(rows):
+            cells = "".join(f"<td>{html.escape(str(v))}</td>" for v in row)
+            lines.append(f'<tr class="zebra">{cells}</tr>' if r % 2 == 1 else f"<tr>{cells}</tr>")
+        lines.append("</tbody></table>")
+        self._block("\n".join(lines))
+
+    def add_code_block(self, text, font_size=9, bold=None, color=None):
+        self._block(f"<pre{_css(color, font_size, bold)}>{html.escape(text)}</pre>")
+
+    def add_page_break(self):
+        self._block('<hr class="page-break">')
+
+    def text(self):
+        body = list(self.blocks)
+        if self._in_list:
+            body.append("</ul>")
+        return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(self.title)}</title>
+<style>
+body {{ font-family: '{FONT_KR}', sans-serif; font-size: 10pt; line-height: 1.15; max-width: 21cm; margin: 2.5cm auto; }}
+pre {{ font-family: '{FONT_CODE}', monospace; white-space: pre-wrap; }}
+table {{ border-collapse: collapse; margin: 0 auto 1em; font-size: 9pt; }}
+th, td {{ border: 1px solid #000; padding: 2pt 4pt; text-align: center; }}
+td:first-child {{ text-align: left; }}
+tr.zebra td {{ background: #{TABLE_ZEBRA}; }}
+hr.page-break {{ border: 0; page-break-after: always; }}
+</style>
+</head>
+<body>
+{chr(10).join(body)}
+</body>
+</html>
+"""
+
+
+def _docx_builder():
+    from .builder import ReportBuilder
+
+    return ReportBuilder()
+
+
+# 확장자 -> builder 생성자
+BACKENDS = {
+    ".docx": _docx_builder,
+    ".md": MarkdownBuilder,
+    ".html": HtmlBuilder,
+}
+
+
+def render_docx(ctx=None, sections=None, workers=1, cache_dir=None):
+    """Render the DOCX report serially, in a process pool or incrementally.
+
+    `workers` other than 1 uses `render_parallel` (0 or None = CPU count);
+    `cache_dir` uses `render_incremental`.  Returns ``(builder, stats)``
+    where `stats` is the cache hit report, or None without a cache.
+    """
+    if ctx is None:
+        ctx = ReportContext()
+    if cache_dir:
+        from .cache import render_incremental
+
+        return render_incremental(ctx, sections=sections, cache_dir=cache_dir,
+                                  workers=workers or os.cpu_count() or 1)
+    if workers == 1:
+        return build_report(_docx_builder(), ctx, sections=sections), None
+    from .parallel import render_parallel
+
+    return render_parallel(ctx, sections=sections, workers=workers or None), None
+
+
+def export_report(paths, ctx=None, sections=None, formats=None):
+    """Render the selected parts once and save them in every format in `paths`.
+
+    The format of each path is taken from `formats` ("docx", "md", "html")
+    when given, else from its extension (see `BACKENDS`).  Only a ``.docx``
+    output goes through python-docx; the text formats replay the recorded
+    model straight into strings.
+    """
+    if ctx is None:
+        ctx = ReportContext()
+    if formats is None:
+        formats = [os.path.splitext(path)[1] for path in paths]
+    factories = []
+    for path, fmt in zip(paths, formats):
+        ext = "." + fmt.lower().lstrip(".")
+        if ext not in BACKENDS:
+            raise ValueError(f"unsupported output format: {path} (expected {', '.join(BACKENDS)})")
+        factories.append((path, BACKENDS[ext]))
+
+    model = build_report(ReportModel(), ctx, sections=sections)
+    return [model.replay(factory()).save(path) for path, factory in factories]
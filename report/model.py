@@ -0,0 +1,47 @@
+"""
+보고서 내용 모델
+- Part 함수가 호출하는 헬퍼(제목/본문/표/코드 블록 …)를 그대로 기록
+- 기록으로 섹션 내용 해시 계산, 다른 builder에 재생
+"""
+import hashlib
+import json
+
+# ReportBuilder와 같은 이름의 내용 헬퍼
+HELPERS = (
+    "add_heading", "add_para", "add_bullet", "make_table",
+    "add_code_block", "add_blank", "add_page_break",
+)
+
+
+class ReportModel:
+    """Builder stand-in that records helper calls instead of rendering.
+
+    Rendering a part into a model is pure Python and cheap, and the record
+    contains everything the part would put in the document: text, table
+    rows, code blocks and every figure taken from the data context.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def replay(self, builder):
+        """Re-issue the recorded calls on `builder` and return it."""
+        for name, args, kwargs in self.calls:
+            getattr(builder, name)(*args, **kwargs)
+        return builder
+
+    def digest(self):
+        """Stable SHA-256 of the recorded content."""
+        payload = json.dumps(self.calls, default=str, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _recorder(name):
+    def record(self, *args, **kwargs):
+        self.calls.append((name, args, kwargs))
+    record.__name__ = name
+    return record
+
+
+for _name in HELPERS:
+    setattr(ReportModel, _name, _recorder(_name))
@@ -0,0 +1,161 @@
+"""
+대용량 부록용 스트리밍 DOCX 출력
+- word/document.xml 을 zip 항목에 바로 써 내려감 (전체 트리를 메모리에 두지 않음)
+- 표지/목차/스타일은 기존 ReportBuilder 헬퍼 그대로 사용
+- 임시 파일에 쓰고 정상 종료 시에만 대상 경로로 교체 (오류 시 잘린 .docx 를 남기지 않음)
+"""
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+from .builder import ReportBuilder, stable_zipinfo
+from .theme import TABLE_HEADER
+
+DOCUMENT_PART = "word/document.xml"
+
+_XML_DECL = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+_NS_DECL = re.compile(rb' xmlns:([\w.-]+)="([^"]*)"')
+_CONTROL = re.compile(r"[\x00-\x1f]")
+# 셀 텍스트 자리표시자 (사용자 영역 문자)
+_SLOT = "\ue000{}\ue000"
+
+
+class _RowSerializer:
+    """Serialize table rows by splicing escaped text into pre-serialized rows.
+
+    Plain cell values (non-empty, no control characters or edge whitespace)
+    are the common case; anything else falls back to building the row
+    element, which handles `w:tab`/`w:br` and ``xml:space``.
+    """
+
+    def __init__(self, writer, template, n_cols):
+        self._writer = writer
+        self._template = template
+        self._n_cols = n_cols
+        slots = [_SLOT.format(c) for c in range(n_cols)]
+        self._pieces = []
+        for r in (0, 1):
+            xml = writer._serialize(template.row(r, slots)).decode("utf-8")
+            parts = re.split("\ue000\\d+\ue000", xml)
+            self._pieces.append([part.encode("utf-8") for part in parts])
+
+    def __call__(self, r, values):
+        texts = [str(val) for val in values]
+        if len(texts) == self._n_cols and all(map(_is_plain, texts)):
+            pieces = self._pieces[r % 2]
+            out = [pieces[0]]
+            for text, piece in zip(texts, pieces[1:]):
+                out.append(escape(text).encode("utf-8"))
+                out.append(piece)
+            return b"".join(out)
+        return self._writer._serialize(self._template.row(r, values))
+
+
+def _is_plain(text):
+    return bool(text) and text == text.strip() and not _CONTROL.search(text)
+
+
+class StreamingDocxWriter:
+    """Stream the body of a DOCX into the zip instead of holding it in memory.
+
+    Content is produced with the usual `ReportBuilder` helpers; `flush()`
+    serializes whatever the builder's body holds and drops it from the tree,
+    and `write_table()` streams arbitrarily long tables row by row.  Styles
+    and the other package parts are written from the builder on close, so
+    character styles registered mid-stream are still included.  Peak memory
+    depends on the largest single flushed block, not on document length.
+    The file appears at `path` only if the block exits without an error::
+
+        with StreamingDocxWriter("appendix.docx") as w:
+            build_report(w.builder, ctx, sections=["cover", "toc"])
+            w.flush()
+            w.write_table(["이름", "ID"], iter_authors())
+    """
+
+    def __init__(self, path, builder=None):
+        self.path = path
+        self.builder = builder if builder is not None else ReportBuilder()
+        self._tmp = None
+        self._zip = None
+        self._out = None
+        self._root_ns = {}
+
+    def __enter__(self):
+        root = self.builder.doc.element
+        self._root_ns = {prefix.encode(): uri.encode() for prefix, uri in root.nsmap.items()}
+        self._tmp = f"{self.path}.tmp{os.getpid()}"
+        self._zip = zipfile.ZipFile(self._tmp, "w", zipfile.ZIP_DEFLATED)
+        self._out = self._zip.open(stable_zipinfo(DOCUMENT_PART), "w", force_zip64=True)
+
+        shell = etree.Element(root.tag, attrib=dict(root.attrib), nsmap=root.nsmap)
+        self._out.write(_XML_DECL)
+        self._out.write(etree.tostring(shell)[:-2] + b">")
+        self._out.write(b"<w:body>")
+        self.flush()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        done = False
+        try:
+            if exc_type is None:
+                self.flush()
+                sectPr = self.builder.doc.element.body.sectPr
+                if sectPr is not None:
+                    self._out.write(self._serialize(sectPr))
+                self._out.write(b"</w:body></w:document>")
+            self._out.close()
+            if exc_type is None:
+                self.builder.copy_package(self._zip, skip={DOCUMENT_PART})
+                done = True
+        finally:
+            self._zip.close()
+            if done:
+                os.replace(self._tmp, self.path)
+            else:
+                os.remove(self._tmp)
+        return False
+
+    def _serialize(self, el):
+        """Serialize `el` without re-declaring namespaces the root declares."""
+        xml = etree.tostring(el, encoding="UTF-8", xml_declaration=False)
+        end = xml.index(b">")
+
+        def keep(m):
+            return b"" if self._root_ns.get(m.group(1)) == m.group(2) else m.group(0)
+
+        return _NS_DECL.sub(keep, xml[:end]) + xml[end:]
+
+    def flush(self):
+        """Write out and release everything the builder has added so far."""
+        body = self.builder.doc.element.body
+        for el in list(body):
+            if el.tag == qn('w:sectPr'):
+                continue
+            self._out.write(self._serialize(el))
+            body.remove(el)
+
+    def write_table(self, headers, rows, col_widths=None, header_color=TABLE_HEADER):
+        """Stream a `make_table`-identical table from any iterable of rows."""
+        self.flush()
+        b = self.builder
+        table, template = b.table_template(headers, col_widths, header_color)
+        tbl = table._tbl
+        tbl.getparent().remove(tbl)
+
+        xml = self._serialize(tbl)
+        close = b"</w:tbl>"
+        self._out.write(xml[:-len(close)])
+        serialize_row = _RowSerializer(self, template, len(headers))
+        count = 0
+        for r, row_data in enumerate(rows):
+            self._out.write(serialize_row(r, row_data))
+            count += 1
+        self._out.write(close)
+
+        b.add_blank()  # make_table과 같은 표 뒤 공백
+        self.flush()
+        return count
@@ -0,0 +1,22 @@
+"""
+보고서 공통 서식 값
+- 출력 형식(DOCX/HTML/Markdown)과 무관한 값만 둠
+- 색상은 hex 문자열, 정렬은 "left" / "center" / "right" / "justify"
+"""
+
+FONT_KR = '맑은 고딕'
+FONT_CODE = 'Consolas'
+
+C_NAVY = "1A1A2E"
+C_BLUE = "0F4C81"
+C_GREEN = "1B7A4D"
+C_PURPLE = "6C3EB6"
+C_ORANGE = "E65100"
+C_RED = "C0392B"
+C_GRAY = "666666"
+C_WHITE = "FFFFFF"
+C_TEAL = "00897B"
+
+# 표 기본 헤더 색 / 짝수 행 음영
+TABLE_HEADER = "0F4C81"
+TABLE_ZEBRA = "F5F5FA"
@@ -0,0 +1,3 @@
+"""
+공통 유틸리티 (텍스트 정규화, 한글 처리)
+"""
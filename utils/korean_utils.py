@@ -0,0 +1,247 @@
+"""
+한글 처리
+- 한글 음절 로마자 변환 (국어의 로마자 표기법, 음운 변화 미반영)
+- 음절 11,172개의 표기 변형 표를 한 번 만들어 배열로 보관 (철 → cheol/chul/...)
+- 한글 이름 성/이름 분리, 성씨 로마자 표기 변형, 이름 변형 LRU 캐시
+"""
+
+import heapq
+from array import array
+from functools import lru_cache
+from itertools import product
+
+HANGUL_FIRST = 0xAC00
+HANGUL_LAST = 0xD7A3
+SYLLABLE_COUNT = HANGUL_LAST - HANGUL_FIRST + 1  # 11,172
+
+# 초성 / 중성 / 종성 표기 변형 (첫 항목이 국어의 로마자 표기법, 나머지는 이름에 흔한 순)
+INITIAL_VARIANTS = [
+    ("g", "k"), ("kk", "gg"), ("n",), ("d", "t"), ("tt", "dd"), ("r", "l"), ("m",),
+    ("b", "p"), ("pp", "bb"), ("s",), ("ss",), ("",), ("j", "ch"), ("jj",), ("ch",),
+    ("k",), ("t",), ("p",), ("h",),
+]
+MEDIAL_VARIANTS = [
+    ("a",), ("ae",), ("ya",), ("yae",), ("eo", "u", "o"), ("e",), ("yeo", "you", "yu", "yo"),
+    ("ye",), ("o", "oh"), ("wa",), ("wae",), ("oe", "oi"), ("yo",), ("u", "oo"),
+    ("wo",), ("we",), ("wi", "wee"), ("yu", "yoo"), ("eu", "u"), ("ui", "ee", "eui"),
+    ("i",),
+]
+FINAL_VARIANTS = [
+    ("",), ("k",), ("k",), ("k",), ("n",), ("n",), ("n",), ("t",), ("l",), ("k",),
+    ("m",), ("l",), ("l",), ("l",), ("p",), ("l",), ("m",), ("p",), ("p",), ("t",),
+    ("t",), ("ng",), ("t",), ("t",), ("k",), ("t",), ("p",), ("t",),
+]
+# ㅅ + ㅣ 계열 모음은 sh 표기도 흔함 (시/신/섭 → shi/shin/sheop)
+_SH_MEDIALS = {2, 6, 12, 17, 20}
+_INITIAL_S = 9
+_INITIAL_NONE = 11
+
+INITIALS = [v[0] for v in INITIAL_VARIANTS]
+MEDIALS = [v[0] for v in MEDIAL_VARIANTS]
+FINALS = [v[0] for v in FINAL_VARIANTS]
+
+MAX_SYLLABLE_VARIANTS = 6
+MAX_NAME_VARIANTS = 12
+NAME_VARIANT_CACHE = 1 << 16
+
+# 두 글자 성
+DOUBLE_SURNAMES = {"남궁", "황보", "제갈", "선우", "독고", "사공", "서문", "동방", "어금", "망절", "소봉"}
+
+# 성씨 -> 로마자 표기 (첫 항목이 대표 표기)
+SURNAME_ROMANIZATIONS = {
+    "김": ("kim", "gim"),
+    "이": ("lee", "yi", "rhee", "rhie", "ri", "i"),
+    "박": ("park", "bak", "pak"),
+    "최": ("choi", "choe"),
+    "정": ("jung", "jeong", "chung"),
+    "강": ("kang", "gang"),
+    "조": ("cho", "jo"),
+    "윤": ("yoon", "yun"),
+    "장": ("jang", "chang"),
+    "임": ("lim", "im", "rim"),
+    "한": ("han",),
+    "오": ("oh", "o"),
+    "서": ("seo", "suh"),
+    "신": ("shin", "sin"),
+    "권": ("kwon", "gwon"),
+    "황": ("hwang",),
+    "안": ("ahn", "an"),
+    "송": ("song",),
+    "류": ("ryu", "yoo", "yu"),
+    "유": ("yoo", "yu", "ryu"),
+    "전": ("jeon", "jun", "chun"),
+    "홍": ("hong",),
+    "고": ("ko", "go"),
+    "문": ("moon", "mun"),
+    "양": ("yang",),
+    "손": ("son", "sohn"),
+    "배": ("bae",),
+    "백": ("baek", "paik"),
+    "허": ("heo", "huh"),
+    "남": ("nam",),
+    "노": ("noh", "roh", "no"),
+    "심": ("shim", "sim"),
+    "하": ("ha",),
+    "곽": ("kwak", "gwak"),
+    "성": ("sung", "seong"),
+    "차": ("cha",),
+    "주": ("joo", "ju"),
+    "우": ("woo", "u"),
+    "구": ("koo", "ku", "gu"),
+    "민": ("min",),
+    "나": ("na", "ra"),
+    "진": ("jin", "chin"),
+    "지": ("ji", "chi"),
+    "엄": ("um", "eom"),
+    "채": ("chae",),
+    "천": ("chun", "cheon"),
+    "방": ("bang",),
+    "현": ("hyun", "hyeon"),
+    "변": ("byun", "byeon"),
+    "남궁": ("namgoong", "namgung"),
+    "황보": ("hwangbo",),
+    "제갈": ("jegal",),
+    "선우": ("sunwoo", "seonu"),
+}
+
+# 로마자 성 표기 -> 대표 표기 (예: gim -> kim, yi -> lee)
+CANONICAL_SURNAMES = {}
+for _variants in SURNAME_ROMANIZATIONS.values():
+    for _v in _variants:
+        CANONICAL_SURNAMES.setdefault(_v, _variants[0])
+
+
+def is_hangul(text):
+    """True if every non-space character is a precomposed Hangul syllable."""
+    chars = [c for c in text if not c.isspace()]
+    return bool(chars) and all(HANGUL_FIRST <= ord(c) <= HANGUL_LAST for c in chars)
+
+
+def _syllable_spellings(code):
+    initial, rest = divmod(code, 21 * 28)
+    medial, final = divmod(rest, 28)
+    initials = INITIAL_VARIANTS[initial]
+    if initial == _INITIAL_S and medial in _SH_MEDIALS:
+        initials += ("sh",)
+    elif initial == _INITIAL_NONE and medial == 13:  # 우 → woo
+        initials += ("w",)
+    ranked = sorted(
+        ((i + m + f, ri + rm) for (ri, i), (rm, m), f in product(
+            enumerate(initials), enumerate(MEDIAL_VARIANTS[medial]), FINAL_VARIANTS[final])),
+        key=lambda item: item[1],
+    )
+    seen = {}
+    for spelling, rank in ranked:
+        seen.setdefault(spelling, rank)
+    return list(seen.items())[:MAX_SYLLABLE_VARIANTS]
+
+
+class _SyllableTable:
+    """Spelling variants of all 11,172 syllables in flat arrays.
+
+    `spellings[offsets[i]:offsets[i + 1]]` are the variants of syllable
+    ``HANGUL_FIRST + i``, Revised Romanization first, and `ranks` holds the
+    matching 0-based "distance from RR" used to order name combinations.
+    """
+
+    def __init__(self):
+        self.spellings = []
+        self.ranks = array("B")
+        self.offsets = array("I", [0])
+        for code in range(SYLLABLE_COUNT):
+            for spelling, rank in _syllable_spellings(code):
+                self.spellings.append(spelling)
+                self.ranks.append(rank)
+            self.offsets.append(len(self.spellings))
+        self.primary = [self.spellings[start] for start in self.offsets[:-1]]
+
+    def variants(self, code):
+        start, end = self.offsets[code], self.offsets[code + 1]
+        return list(zip(self.spellings[start:end], self.ranks[start:end]))
+
+
+@lru_cache(maxsize=1)
+def syllable_table():
+    """The shared `_SyllableTable`, built on first use (~11K entries)."""
+    return _SyllableTable()
+
+
+def romanize_syllable(ch):
+    code = ord(ch) - HANGUL_FIRST
+    if not 0 <= code < SYLLABLE_COUNT:
+        return ch
+    return syllable_table().primary[code]
+
+
+def romanize(text):
+    """Romanize Hangul syllables one by one; other characters pass through."""
+    primary = syllable_table().primary
+    return "".join(primary[ord(ch) - HANGUL_FIRST] if HANGUL_FIRST <= ord(ch) <= HANGUL_LAST
+                   else ch for ch in text)
+
+
+def syllable_variants(ch):
+    """Latin spellings of one syllable, RR first (e.g. 철 -> cheol, chul, ...)."""
+    code = ord(ch) - HANGUL_FIRST
+    if not 0 <= code < SYLLABLE_COUNT:
+        return (ch,)
+    return tuple(spelling for spelling, _ in syllable_table().variants(code))
+
+
+@lru_cache(maxsize=NAME_VARIANT_CACHE)
+def given_name_variants(given, limit=MAX_NAME_VARIANTS):
+    """Joined Latin spellings of a Hangul given name, most RR-like first.
+
+    Combinations are ranked by the summed per-syllable rank, so 철수 gives
+    "cheolsu" first and then "cheolsoo", "chulsu", ... up to `limit`.
+    Enumerated best-first with a heap, so the cost depends on `limit`
+    rather than on the number of combinations (exponential in length).
+    Memoized: given names repeat millions of times across the records.
+    """
+    table = syllable_table()
+    per_syllable = []
+    for ch in given:
+        code = ord(ch) - HANGUL_FIRST
+        variants = table.variants(code) if 0 <= code < SYLLABLE_COUNT else [(ch, 0)]
+        # (rank, 원래 위치, 표기) 순 정렬: 동점은 기존 product 순서를 유지
+        per_syllable.append(sorted((rank, pos, spelling)
+                                   for pos, (spelling, rank) in enumerate(variants)))
+    if not per_syllable:
+        return ("",)[:limit]
+
+    # 힙 키 (순위 합, 원래 위치 튜플): 후속 조합의 키는 항상 부모 이상이므로 꺼내는 순서가 전체 정렬 순서
+    def entry(state):
+        picked = [options[i] for options, i in zip(per_syllable, state)]
+        return (sum(p[0] for p in picked), tuple(p[1] for p in picked), state,
+                "".join(p[2] for p in picked))
+
+    start = (0,) * len(per_syllable)
+    heap, visited, seen = [entry(start)], {start}, {}
+    while heap and len(seen) < limit:
+        _, _, state, spelling = heapq.heappop(heap)
+        seen.setdefault(spelling)
+        for j, options in enumerate(per_syllable):
+            if state[j] + 1 < len(options):
+                child = state[:j] + (state[j] + 1,) + state[j + 1:]
+                if child not in visited:
+                    visited.add(child)
+                    heapq.heappush(heap, entry(child))
+    return tuple(seen)
+
+
+def split_korean_name(name):
+    """Split a Hangul name into (surname, given name)."""
+    name = name.replace(" ", "")
+    if len(name) >= 3 and name[:2] in DOUBLE_SURNAMES:
+        return name[:2], name[2:]
+    return name[:1], name[1:]
+
+
+def surname_romanizations(surname):
+    """Latin spellings of a Hangul surname, canonical form first."""
+    return SURNAME_ROMANIZATIONS.get(surname) or syllable_variants(surname[:1])
+
+
+def canonical_surname(romanized):
+    """Map a Latin surname spelling to its canonical form ("gim" -> "kim")."""
+    return CANONICAL_SURNAMES.get(romanized, romanized)
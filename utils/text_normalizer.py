@@ -0,0 +1,31 @@
+"""
+텍스트 정규화
+- 저자명/기관명 비교 전 공통 정규화 (NFKC, 소문자, 구두점, 공백)
+"""
+import re
+import unicodedata
+
+_SPACES = re.compile(r"\s+")
+# 이름 구분에 쓰는 쉼표/하이픈 외 구두점
+_NAME_PUNCT = re.compile(r"[^\w\s,\-]")
+
+
+def normalize_text(text):
+    """NFKC, lower-case and collapse whitespace; None for blank input."""
+    if text is None:
+        return None
+    text = _SPACES.sub(" ", unicodedata.normalize("NFKC", str(text))).strip().lower()
+    return text or None
+
+
+def normalize_name(name):
+    """`normalize_text` plus dropping punctuation other than ',' and '-'.
+
+    Periods become spaces so "J.S." splits into initials.
+    """
+    text = normalize_text(name)
+    if text is None:
+        return None
+    text = _NAME_PUNCT.sub(" ", text.replace(".", " "))
+    text = _SPACES.sub(" ", text).strip(" ,-")
+    return text or None